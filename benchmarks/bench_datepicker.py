@@ -0,0 +1,253 @@
+"""Benchmarks for the hot paths of DatePicker and DateSelect.
+
+Every benchmark runs in a headless app (App.run_test) and measures the wall
+time, the number of widgets and the peak memory (tracemalloc, in a separate
+run so it does not distort the time).
+
+    # run all benchmarks, write the results as JSON
+    python benchmarks/bench_datepicker.py --output results.json
+
+    # compare with an earlier run, fails if something got slower
+    python benchmarks/bench_datepicker.py --compare results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from textual.app import App, ComposeResult
+from textual.containers import Container
+
+from textual_datepicker import DatePicker, DateSelect
+from textual_datepicker._clock import FixedClock, set_clock
+
+# all benchmarks run on the same day, a month with 6 rows
+TODAY = datetime.date(2022, 10, 12)
+
+
+class Measure:
+    """Measures the wall time and, if wanted, the peak memory of a block."""
+
+    def __init__(self, trace_memory: bool) -> None:
+        self.trace_memory = trace_memory
+        self.wall_time: float | None = None
+        self.peak_memory: int | None = None
+
+    def __enter__(self) -> Measure:
+        gc.collect()
+        if self.trace_memory:
+            tracemalloc.start()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall_time = time.perf_counter() - self._start
+        if self.trace_memory:
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+
+class BenchApp(App):
+    """An empty app, the benchmarks mount their widgets into #main_container."""
+
+    def compose(self) -> ComposeResult:
+        yield Container(id="main_container")
+
+
+def widget_count(app: App) -> int:
+    return len(app.query("*"))
+
+
+Benchmark = Callable[..., Awaitable[int]]
+
+# name -> (benchmark, list of parameters)
+BENCHMARKS: dict[str, tuple[Benchmark, list[dict[str, Any]]]] = {}
+
+GRIDS = [{"day_grid": False}, {"day_grid": True}]
+
+
+def benchmark(name: str, params: list[dict[str, Any]]):
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = (function, params)
+        return function
+    return register
+
+
+@benchmark("date_picker_compose", GRIDS)
+async def bench_compose(measure: Measure, day_grid: bool) -> int:
+    app = BenchApp()
+    async with app.run_test() as pilot:
+        container = app.query_one("#main_container")
+        with measure:
+            await container.mount(DatePicker(day_grid=day_grid))
+            await pilot.pause()
+        return widget_count(app)
+
+
+@benchmark("next_month_1000", GRIDS)
+async def bench_next_month(measure: Measure, day_grid: bool) -> int:
+    app = BenchApp()
+    async with app.run_test() as pilot:
+        date_picker = DatePicker(day_grid=day_grid)
+        await app.query_one("#main_container").mount(date_picker)
+        await pilot.pause()
+        with measure:
+            for _ in range(1000):
+                date_picker._next_month()
+            await pilot.pause()
+        return widget_count(app)
+
+
+@benchmark("arrow_sweep_year", GRIDS)
+async def bench_arrow_sweep(measure: Measure, day_grid: bool) -> int:
+    app = BenchApp()
+    async with app.run_test() as pilot:
+        date_picker = DatePicker(day_grid=day_grid)
+        await app.query_one("#main_container").mount(date_picker)
+        date_picker.date = datetime.date(TODAY.year, 1, 1)
+        date_picker._focus_index(date_picker.layout.first_index)
+        await pilot.pause()
+        with measure:
+            for _ in range(365):
+                await pilot.press("right")
+        return widget_count(app)
+
+
+SELECT_MODES = [
+    {"shared_dialog": False, "lazy_dialog": False},
+    {"shared_dialog": True, "lazy_dialog": False},
+    {"shared_dialog": False, "lazy_dialog": True},
+]
+
+
+@benchmark("date_select_open_close_50", SELECT_MODES)
+async def bench_open_close(measure: Measure, **options) -> int:
+    app = BenchApp()
+    async with app.run_test() as pilot:
+        await app.query_one("#main_container").mount(
+            DateSelect(picker_mount="#main_container", **options))
+        await pilot.pause()
+        await pilot.press("tab")
+        with measure:
+            for _ in range(50):
+                # open and select today, which closes the dialog
+                await pilot.press("enter")
+                await pilot.press("enter")
+        return widget_count(app)
+
+
+def screen_params(sizes: list[int]) -> list[dict[str, Any]]:
+    return [dict(mode, count=count) for count in sizes for mode in SELECT_MODES]
+
+
+@benchmark("date_select_screen", screen_params([10, 100, 1000]))
+async def bench_screen(measure: Measure, count: int, **options) -> int:
+    app = BenchApp()
+    async with app.run_test() as pilot:
+        container = app.query_one("#main_container")
+        with measure:
+            await container.mount(*(
+                DateSelect(picker_mount="#main_container", **options)
+                for _ in range(count)
+            ))
+            await pilot.pause()
+        return widget_count(app)
+
+
+async def run_benchmark(function: Benchmark, params: dict[str, Any]) -> dict:
+    timing = Measure(trace_memory=False)
+    widgets = await function(timing, **params)
+    memory = Measure(trace_memory=True)
+    await function(memory, **params)
+    return {
+        "wall_time": timing.wall_time,
+        "widgets": widgets,
+        "peak_memory": memory.peak_memory,
+    }
+
+
+def case_name(name: str, params: dict[str, Any]) -> str:
+    args = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"{name}[{args}]"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Returns the cases which are slower or bigger than the baseline by more
+    than threshold (0.2: 20%)."""
+    regressions = []
+    for case, result in results.items():
+        old = baseline.get(case)
+        if old is None:
+            continue
+        for key in ("wall_time", "widgets", "peak_memory"):
+            if old[key] and result[key] > old[key] * (1 + threshold):
+                regressions.append(
+                    f"{case} {key}: {old[key]:.6g} -> {result[key]:.6g}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path,
+                        help="write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path,
+                        help="JSON results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed regression when comparing (default: 0.2)")
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks containing this text")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="numbers of DateSelects for date_select_screen")
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        function, _ = BENCHMARKS["date_select_screen"]
+        BENCHMARKS["date_select_screen"] = (function, screen_params(args.sizes))
+
+    set_clock(FixedClock(TODAY))
+
+    results = {}
+    for name, (function, params_list) in BENCHMARKS.items():
+        for params in params_list:
+            case = case_name(name, params)
+            if args.filter not in case:
+                continue
+            result = asyncio.run(run_benchmark(function, params))
+            results[case] = result
+            print(
+                f"{case:70} {result['wall_time'] * 1000:10.1f} ms"
+                f" {result['widgets']:8} widgets"
+                f" {result['peak_memory'] / 1024:10.0f} KiB",
+                file=sys.stderr,
+            )
+
+    output = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(output, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
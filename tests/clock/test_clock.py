@@ -0,0 +1,42 @@
+import datetime
+import time
+import unittest
+from unittest import mock
+
+from textual_datepicker._clock import Clock, FixedClock, get_clock, set_clock
+
+
+class ClockCases(unittest.TestCase):
+    def test_today(self):
+        clock = Clock()
+        assert clock.today() == datetime.date.today()
+        assert 0 < clock.seconds_until_tomorrow() <= 24 * 60 * 60
+
+    def test_today_is_cached(self):
+        clock = Clock()
+        today = clock.today()
+        with mock.patch("datetime.date") as date:
+            assert clock.today() is today
+        date.fromtimestamp.assert_not_called()
+
+    def test_today_changes_at_midnight(self):
+        clock = Clock()
+        today = clock.today()
+        tomorrow = today + datetime.timedelta(days=1)
+        with mock.patch("time.time", return_value=clock._expires + 60):
+            assert clock.today() == tomorrow
+
+    def test_fixed_clock(self):
+        clock = FixedClock(datetime.datetime(2022, 8, 15, 12))
+        assert clock.today() == datetime.date(2022, 8, 15)
+        assert type(clock.today()) is datetime.date
+        assert clock.seconds_until_tomorrow() is None
+
+    def test_set_clock(self):
+        clock = get_clock()
+        fixed_clock = FixedClock(datetime.date(2022, 8, 15))
+        try:
+            set_clock(fixed_clock)
+            assert get_clock() is fixed_clock
+        finally:
+            set_clock(clock)
@@ -0,0 +1,91 @@
+import asyncio
+import datetime
+import unittest
+from unittest import mock
+
+from textual_datepicker._constraints import DateConstraints
+
+
+def enabled_days(constraints, year, month):
+    mask = constraints.month_mask(year, month)
+    return [day for day in range(1, 32) if mask >> (day - 1) & 1]
+
+
+class DateConstraintsCases(unittest.TestCase):
+    def test_no_constraints(self):
+        constraints = DateConstraints()
+        assert enabled_days(constraints, 2022, 2) == list(range(1, 29))
+
+    def test_min_max_date(self):
+        constraints = DateConstraints(min_date=datetime.date(2022, 8, 10),
+                                      max_date=datetime.date(2022, 9, 5))
+        assert enabled_days(constraints, 2022, 7) == []
+        assert enabled_days(constraints, 2022, 8) == list(range(10, 32))
+        assert enabled_days(constraints, 2022, 9) == [1, 2, 3, 4, 5]
+        assert enabled_days(constraints, 2022, 10) == []
+        assert constraints.is_enabled(datetime.date(2022, 8, 10))
+        assert not constraints.is_enabled(datetime.date(2022, 8, 9))
+
+    def test_disabled_weekdays_and_holidays(self):
+        # 2022-08-01 is a monday, no weekends and no 15th
+        constraints = DateConstraints(
+            disabled_weekdays=[5, 6], holidays=[datetime.date(2022, 8, 15)])
+        days = enabled_days(constraints, 2022, 8)
+        assert days[:6] == [1, 2, 3, 4, 5, 8]
+        assert 15 not in days
+        assert len(days) == 22
+
+    def test_is_selectable_called_once_per_day(self):
+        is_selectable = mock.Mock(side_effect=lambda date: date.day % 2 == 1)
+        constraints = DateConstraints(is_selectable=is_selectable)
+        assert enabled_days(constraints, 2022, 8) == list(range(1, 32, 2))
+        constraints.month_mask(2022, 8)
+        constraints.is_enabled(datetime.date(2022, 8, 3))
+        assert is_selectable.call_count == 31
+
+    def test_read_only(self):
+        constraints = DateConstraints(min_date=datetime.date(2022, 8, 10))
+        with self.assertRaises(AttributeError):
+            constraints.min_date = datetime.date(2022, 8, 1)
+        with self.assertRaises(AttributeError):
+            constraints.disabled_weekdays = {5}
+
+    def test_clear_cache(self):
+        closed = {datetime.date(2022, 8, 3)}
+        constraints = DateConstraints(is_selectable=lambda date: date not in closed)
+        assert not constraints.is_enabled(datetime.date(2022, 8, 3))
+        closed = set()
+        # still compiled with the old source
+        assert not constraints.is_enabled(datetime.date(2022, 8, 3))
+        constraints.clear_cache()
+        assert constraints.is_enabled(datetime.date(2022, 8, 3))
+
+    def test_next_enabled(self):
+        constraints = DateConstraints(disabled_weekdays=[5, 6])
+        # friday the 5th -> monday the 8th, and back
+        assert constraints.next_enabled(2022, 8, 5, 1) == 8
+        assert constraints.next_enabled(2022, 8, 8, -1) == 5
+        assert constraints.next_enabled(2022, 8, 31, 1) is None
+        assert constraints.next_enabled(2022, 8, 1, -1) is None
+        assert constraints.next_enabled(2022, 8, 1, 7) == 8
+        assert constraints.next_enabled(2022, 8, 29, 7) is None
+
+        constraints = DateConstraints(holidays=[datetime.date(2022, 8, 8)])
+        assert constraints.next_enabled(2022, 8, 1, 7) == 15
+        assert constraints.next_enabled(2022, 8, 15, -7) == 1
+
+    def test_async_disabled_dates(self):
+        async def disabled_dates(start, end):
+            return [start, end]
+
+        constraints = DateConstraints(disabled_weekdays=[6],
+                                      disabled_dates=disabled_dates)
+        assert constraints.needs_load(2022, 8)
+        assert 1 in enabled_days(constraints, 2022, 8)
+
+        asyncio.run(constraints.load_month(2022, 8))
+        assert not constraints.needs_load(2022, 8)
+        days = enabled_days(constraints, 2022, 8)
+        assert 1 not in days and 31 not in days and 7 not in days
+        assert len(days) == 25
+        assert not DateConstraints().needs_load(2022, 8)
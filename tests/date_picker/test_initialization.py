@@ -2,6 +2,8 @@ import unittest
 import pendulum
 
 from textual_datepicker import DatePicker
+from textual_datepicker._date_picker import DayLabel
+from textual_datepicker._clock import FixedClock
 
 
 class AttributeCases(unittest.TestCase):
@@ -12,3 +14,49 @@ class AttributeCases(unittest.TestCase):
     def test_date_is_this_month_by_default(self):
         date_picker = DatePicker()
         assert date_picker.date == pendulum.today().start_of("month")
+
+    def test_date_from_clock(self):
+        date_picker = DatePicker(clock=FixedClock(pendulum.datetime(2022, 8, 15)))
+        assert date_picker.date == pendulum.datetime(2022, 8, 1, tz="local")
+
+    def test_locale_and_firstweekday(self):
+        date_picker = DatePicker(
+            clock=FixedClock(pendulum.datetime(2023, 3, 15)),
+            locale="de",
+            firstweekday=6,
+        )
+        assert date_picker.names.weekdays[:2] == ("So", "Mo")
+        # march 2023 starts on a wednesday, the 4th column from sunday
+        assert date_picker.layout.first_index == 3
+        assert date_picker.layout.index_of(15) == 17
+
+
+class DayLabelCases(unittest.TestCase):
+    def test_day(self):
+        day_label = DayLabel(5)
+        assert day_label.day == 5
+        assert day_label.label == "5"
+        assert day_label.can_focus
+        assert day_label.has_class("--day")
+        assert day_label.render().plain == " 5"
+
+    def test_empty_day(self):
+        day_label = DayLabel(0)
+        assert day_label.day is None
+        assert not day_label.can_focus
+        assert not day_label.has_class("--day")
+        assert day_label.render().plain == "  "
+
+    def test_str_label(self):
+        assert DayLabel("12").day == 12
+
+    def test_set_label(self):
+        day_label = DayLabel(5)
+        day_label.label = "0"
+        assert day_label.day is None
+        assert not day_label.can_focus
+        assert not day_label.has_class("--day")
+        day_label.label = 12
+        assert day_label.label == "12"
+        assert day_label.can_focus
+        assert day_label.render().plain == "12"
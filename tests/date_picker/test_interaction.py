@@ -1,6 +1,8 @@
 import pytest
 import pendulum
 import asyncio
+import datetime
+from unittest import mock
 
 from textual.app import App, ComposeResult
 from textual.containers import Container
@@ -8,6 +10,12 @@ from textual.widget import events
 from rich.text import Text
 
 from textual_datepicker import DatePicker
+from textual_datepicker._date_picker import DayGrid, DayLabel, MonthHeader
+from textual_datepicker._clock import FixedClock
+from textual_datepicker._dates import DateAdapter
+from textual_datepicker._constraints import DateConstraints
+from textual_datepicker._markers import MarkerIndex, MarkerProvider
+from textual_datepicker._zoom import ZoomGrid
 
 
 @pytest.mark.asyncio
@@ -307,3 +315,865 @@ async def test_day_click():
         await first_day_label.post_message(click)
         await first_day.post_message(click)
         await pilot.press("tab")
+
+
+@pytest.mark.asyncio
+async def test_day_grid_keys():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(day_grid=True),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        month_header = app.query_one("DatePicker MonthHeader")
+        assert len(app.query("DatePicker DayLabel")) == 0
+        assert len(app.query("DatePicker DayGrid")) == 1
+
+        aug22 = pendulum.datetime(2022, 8, 1, 0, 0, 0)
+        date_picker.date = aug22
+
+        await pilot.press("tab")
+        await pilot.press("tab")
+        await pilot.press("tab")
+        assert isinstance(app.focused, DayGrid)
+        assert app.focused.day == 1
+
+        await pilot.press("right")
+        await pilot.press("right")
+        await pilot.press("right")
+        await pilot.press("down")
+        assert app.focused.day == 11
+
+        await pilot.press("left")
+        await pilot.press("left")
+        await pilot.press("down")
+        await pilot.press("down")
+        await pilot.press("down")
+        assert app.focused.day == 30
+        await pilot.press("down")
+        assert app.focused.day == 30
+        await pilot.press("left")
+        await pilot.press("left")
+        assert app.focused.day == 25
+        jul22 = aug22.add(months=-1)
+        assert date_picker.date == jul22
+        assert month_header.renderable == Text(jul22.format(month_header.format))
+
+        # empty day after the month change moves the cursor
+        for _ in range(6):
+            await pilot.press("right")
+        assert date_picker.date == jul22
+        assert app.focused.day == 31
+        await pilot.press("right")
+        assert date_picker.date == aug22
+        assert app.focused.day == 28
+
+        await pilot.press("enter")
+        assert date_picker.selected_date == pendulum.datetime(2022, 8, 28)
+
+        await pilot.press("home")
+        assert date_picker.date == pendulum.today()
+        assert app.focused.cursor == app.focused.today_index
+        assert app.focused.day == pendulum.today().day
+
+
+@pytest.mark.asyncio
+async def test_day_grid_click():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(day_grid=True),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        day_grid = app.query_one(DayGrid)
+
+        aug22 = pendulum.datetime(2022, 8, 1, 0, 0, 0)
+        date_picker.date = aug22
+        # 2022-08-01 is a monday, 2nd row, 3rd column: 10
+        assert day_grid.index_at(8, 2) == 9
+        assert day_grid.index_at(9, 2) == 9
+        # gutters and empty days
+        assert day_grid.index_at(10, 2) is None
+        assert day_grid.index_at(8, 1) is None
+        assert day_grid.index_at(24, 8) is None
+
+        await pilot.hover(DayGrid, offset=(8, 2))
+        assert day_grid.hover == 9
+        await pilot.click(DayGrid, offset=(8, 2))
+        assert app.focused is day_grid
+        assert day_grid.day == 10
+        assert date_picker.selected_date == pendulum.datetime(2022, 8, 10)
+
+        lines = [day_grid.render_line(y).text for y in range(11)]
+        assert lines[0] == " 1   2   3   4   5   6   7"
+        assert lines[1].strip() == ""
+        assert lines[10].strip() == ""
+
+
+@pytest.mark.asyncio
+async def test_month_change_updates_changed_days_only():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        # both months start on a monday, march has 3 more days
+        date_picker.date = pendulum.datetime(2021, 2, 1)
+
+        with mock.patch.object(DayLabel, "update", autospec=True,
+                               side_effect=DayLabel.update) as update:
+            date_picker.date = pendulum.datetime(2021, 3, 1)
+
+        assert update.call_count == 3
+        day_labels = date_picker.day_container.children
+        assert [day_label.day for day_label in day_labels[27:32]] == [
+            28, 29, 30, 31, None]
+
+
+@pytest.mark.asyncio
+async def test_navigation_without_queries():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        date_picker.date = pendulum.datetime(2022, 8, 1)
+
+        await pilot.press("tab")
+        await pilot.press("tab")
+        await pilot.press("tab")
+        assert date_picker.focused == 0
+        assert date_picker.focused_day.day == 1
+
+        with mock.patch.object(DatePicker, "query", side_effect=AssertionError), \
+                mock.patch.object(DatePicker, "query_one", side_effect=AssertionError):
+            await pilot.press("right")
+            await pilot.press("down")
+            await pilot.press("left")
+            await pilot.press("up")
+            await pilot.press("right")
+
+        assert date_picker.focused == 1
+        assert app.focused.day == 2
+        assert date_picker.focused_date == pendulum.datetime(2022, 8, 2)
+
+        app.query("DatePicker MonthControl").first().focus()
+        await pilot.pause()
+        assert date_picker.focused_day is None
+        assert date_picker.focused_date is None
+
+
+@pytest.mark.asyncio
+async def test_coalesce_months():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(coalesce_months=True),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        aug22 = pendulum.datetime(2022, 8, 1)
+        date_picker.date = aug22
+
+        with mock.patch.object(DatePicker, "_update_day_widgets",
+                               autospec=True) as update:
+            for _ in range(12):
+                date_picker._next_month()
+            date_picker._prev_month()
+            assert date_picker.date == aug22
+            await pilot.pause()
+
+        assert update.call_count == 1
+        assert date_picker.date == aug22.add(months=11)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_months_interval():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(coalesce_months=True, coalesce_interval=0.05),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        aug22 = pendulum.datetime(2022, 8, 1)
+        date_picker.date = aug22
+
+        await pilot.press("tab")
+        for _ in range(3):
+            await pilot.press("pagedown")
+        await pilot.pause(0.2)
+        assert date_picker.date == aug22.add(months=3)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_months_with_day_keys():
+    """Day moves while a month change is collected start in its month."""
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            # the first one without coalescing
+            for coalesce_months, coalesce_interval in (
+                    (False, None), (True, None), (True, 0.05)):
+                for day_grid in (False, True):
+                    yield DatePicker(
+                        coalesce_months=coalesce_months,
+                        coalesce_interval=coalesce_interval,
+                        day_grid=day_grid, date_adapter=DateAdapter(),
+                        clock=FixedClock(datetime.date(2022, 8, 31)))
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        for date_picker in app.query(DatePicker):
+            date_picker.focus_default_day()
+            await pilot.pause()
+            # the 31st nudges to the 28th of september, then the 29th
+            date_picker._handle_right()
+            date_picker._handle_right()
+            await pilot.pause(0.1)
+            assert date_picker.date == datetime.date(2022, 9, 1)
+            assert date_picker.focused_date == datetime.date(2022, 9, 29)
+
+            if not date_picker.coalesce_months:
+                continue
+            # into october, back to september and on to the 7th, while the
+            # change to october is collected
+            for move in ("right", "right", "up", "up", "up", "up", "left",
+                         "left", "left", "left", "left", "right", "right"):
+                getattr(date_picker, f"_handle_{move}")()
+            await pilot.pause(0.1)
+            assert date_picker.date == datetime.date(2022, 9, 1)
+            assert date_picker.focused_date == datetime.date(2022, 9, 7)
+
+
+@pytest.mark.asyncio
+async def test_today_moves_at_midnight():
+    class MidnightClock(FixedClock):
+        """Changes to the next day once."""
+        def seconds_until_tomorrow(self):
+            if self._today.day == 15:
+                self._today = self._today.replace(day=16)
+                return 0.05
+            return None
+
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(clock=FixedClock(pendulum.datetime(2022, 8, 15))),
+                DatePicker(day_grid=True,
+                           clock=FixedClock(pendulum.datetime(2022, 8, 15))),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker, grid_picker = app.query(DatePicker)
+        assert date_picker.date == pendulum.datetime(2022, 8, 1, tz="local")
+        assert app.query_one("DatePicker DayLabel.--today").day == 15
+        assert grid_picker.day_grid.today_index == 14
+
+        date_picker.clock = MidnightClock(pendulum.datetime(2022, 8, 15))
+        grid_picker.clock = MidnightClock(pendulum.datetime(2022, 8, 15))
+        date_picker._schedule_new_day()
+        grid_picker._schedule_new_day()
+        await pilot.pause(0.2)
+        assert app.query_one("DatePicker DayLabel.--today").day == 16
+        assert grid_picker.day_grid.today_index == 15
+
+
+@pytest.mark.asyncio
+async def test_date_adapter():
+    """Without pendulum, the picker works with datetime.date."""
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 15))),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        month_header = app.query_one("DatePicker MonthHeader")
+        assert date_picker.date == datetime.date(2022, 8, 1)
+        assert month_header.renderable == Text("August\n2022")
+
+        await pilot.press("tab")
+        await pilot.press("pagedown")
+        assert date_picker.date == datetime.date(2022, 9, 1)
+        assert type(date_picker.date) is datetime.date
+
+        await pilot.press("home")
+        assert date_picker.date == datetime.date(2022, 8, 15)
+        await pilot.press("right")
+        await pilot.press("enter")
+        assert date_picker.selected_date == datetime.date(2022, 8, 16)
+        assert type(date_picker.selected_date) is datetime.date
+
+
+@pytest.mark.asyncio
+async def test_month_change_moves_focus_in_one_batch():
+    class MonthControlApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(),
+            )
+    app = MonthControlApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        date_picker.date = pendulum.datetime(2022, 8, 1)
+        date_picker._focus_index(30)
+        await pilot.pause()
+        assert app.focused.day == 31
+
+        with mock.patch.object(DatePicker, "on_day_label_focus_lost") as focus_lost, \
+                mock.patch.object(app, "batch_update",
+                                  wraps=app.batch_update) as batch_update:
+            # february 2021 has only 4 rows, the focus moves to the 28th
+            date_picker.date = pendulum.datetime(2021, 2, 1)
+            day_labels = date_picker.day_container.children
+            assert app.focused is day_labels[27]
+            assert date_picker.focused == 27
+            assert day_labels[30].day is None
+            await pilot.pause()
+
+        batch_update.assert_called_once()
+        focus_lost.assert_not_called()
+        assert app.focused.day == 28
+
+
+@pytest.mark.asyncio
+async def test_select_range():
+    class RangeApp(App):
+        ranges = []
+
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(select_range=True, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 15))),
+            )
+
+        def on_date_picker_range_selected(self, event: DatePicker.RangeSelected):
+            self.ranges.append((event.start, event.end))
+    app = RangeApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        day_labels = date_picker.day_container.children
+
+        def in_range():
+            return [label.day for label in day_labels if label.has_class("--range")]
+
+        # august 2022 starts on a monday
+        await pilot.press("tab")
+        await pilot.press("home")
+        await pilot.press("enter")
+        assert date_picker.range_start == datetime.date(2022, 8, 15)
+        assert date_picker.range_end is None
+        assert in_range() == [15]
+
+        # the preview follows the focus, only new days are re-styled
+        with mock.patch.object(DayLabel, "set_class", autospec=True,
+                               side_effect=DayLabel.set_class) as set_class:
+            await pilot.press("right")
+            await pilot.press("right")
+        assert set_class.call_count == 2
+        assert in_range() == [15, 16, 17]
+
+        # before the start, the range is turned around
+        await pilot.press("up")
+        assert in_range() == [10, 11, 12, 13, 14, 15]
+
+        # across the month: end in september
+        await pilot.press("pagedown")
+        assert in_range() == []
+        date_picker._focus_index(date_picker.layout.index_of(2))
+        await pilot.pause()
+        assert in_range() == [1, 2]
+        await pilot.press("enter")
+        await pilot.pause()
+        assert app.ranges == [
+            (datetime.date(2022, 8, 15), datetime.date(2022, 9, 2))]
+        assert date_picker.range_end == datetime.date(2022, 9, 2)
+
+        # no preview after the end is selected
+        await pilot.press("right")
+        assert in_range() == [1, 2]
+
+        await pilot.press("pageup")
+        assert in_range() == list(range(15, 32))
+
+
+@pytest.mark.asyncio
+async def test_select_range_day_grid():
+    class RangeApp(App):
+        ranges = []
+
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(select_range=True, day_grid=True,
+                           date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 15))),
+            )
+
+        def on_date_picker_range_selected(self, event: DatePicker.RangeSelected):
+            self.ranges.append((event.start, event.end))
+    app = RangeApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        day_grid = date_picker.day_grid
+
+        # the 3rd, on the first row
+        await pilot.click(DayGrid, offset=(8, 0))
+        assert date_picker.range_start == datetime.date(2022, 8, 3)
+        assert day_grid.range == range(2, 3)
+
+        # hover the 10th on the 2nd row, only the lines of changed days repaint
+        with mock.patch.object(day_grid, "refresh_days",
+                               wraps=day_grid.refresh_days) as refresh_days:
+            await pilot.hover(DayGrid, offset=(8, 2))
+        assert day_grid.range == range(2, 10)
+        assert sorted(refresh_days.call_args_list[-1].args) == list(range(3, 10))
+
+        await pilot.click(DayGrid, offset=(8, 2))
+        await pilot.pause()
+        assert app.ranges == [
+            (datetime.date(2022, 8, 3), datetime.date(2022, 8, 10))]
+
+        range_style = day_grid.get_component_rich_style("day-grid--range")
+        segment = [s for s in day_grid.render_line(0) if s.text == " 3"][0]
+        assert segment.style.bgcolor == range_style.bgcolor
+
+
+@pytest.mark.asyncio
+async def test_constraints():
+    # 2022-08-01 is a monday, no weekends and no 10th
+    constraints = DateConstraints(
+        max_date=datetime.date(2022, 8, 20),
+        disabled_weekdays=[5, 6],
+        holidays=[datetime.date(2022, 8, 10)],
+    )
+
+    class ConstraintsApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 4))),
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 4)),
+                           day_grid=True),
+            )
+    app = ConstraintsApp()
+
+    async with app.run_test() as pilot:
+        date_picker, grid_picker = app.query(DatePicker)
+        day_labels = date_picker.day_container.children
+        disabled = [label.day for label in day_labels if label.has_class("--disabled")]
+        assert disabled == [6, 7, 10, 13, 14] + list(range(20, 32))
+        assert grid_picker.day_grid.disabled_days == date_picker.model.disabled_days()
+
+        for picker in (date_picker, grid_picker):
+            picker._focus_index(3)
+            await pilot.pause()
+            # thursday the 4th -> friday -> monday
+            await pilot.press("right")
+            await pilot.press("right")
+            assert picker.focused_date == datetime.date(2022, 8, 8)
+            # wednesday the 10th is a holiday
+            await pilot.press("right")
+            await pilot.press("right")
+            assert picker.focused_date == datetime.date(2022, 8, 11)
+            # the 18th, then no more thursdays until the max date
+            await pilot.press("down")
+            await pilot.press("down")
+            assert picker.focused_date == datetime.date(2022, 8, 18)
+            await pilot.press("enter")
+            assert picker.selected_date == datetime.date(2022, 8, 18)
+
+        # disabled days can't be selected
+        date_picker._select_day(10)
+        assert date_picker.selected_date == datetime.date(2022, 8, 18)
+
+        # all days of september are after the max date
+        date_picker.date = datetime.date(2022, 9, 1)
+        assert len(date_picker.query("DayLabel.--disabled")) == 30
+
+        grid_picker.constraints = None
+        assert grid_picker.day_grid.disabled_days == 0
+
+
+@pytest.mark.asyncio
+async def test_markers():
+    markers = MarkerIndex([
+        (datetime.date(2022, 8, 1), "event"),
+        (datetime.date(2022, 8, 1), "birthday"),
+        (datetime.date(2022, 8, 15), "event"),
+        (datetime.date(2022, 9, 1), "event"),
+    ])
+
+    class MarkersApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(markers=markers, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 4))),
+                DatePicker(markers=markers, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 4)),
+                           day_grid=True),
+            )
+    app = MarkersApp()
+
+    async with app.run_test() as pilot:
+        date_picker, grid_picker = app.query(DatePicker)
+        day_labels = date_picker.day_container.children
+
+        def marked():
+            return [label.day for label in day_labels if label.has_class("--marked")]
+
+        assert marked() == [1, 15]
+        assert day_labels[0].has_class("--marker-event", "--marker-birthday")
+        assert not day_labels[14].has_class("--marker-birthday")
+        assert grid_picker.day_grid.markers == {
+            0: frozenset({"event", "birthday"}), 14: frozenset({"event"})}
+
+        # moving within the month doesn't query the provider
+        with mock.patch.object(markers, "markers", wraps=markers.markers) as query:
+            await pilot.press("tab")
+            await pilot.press("tab")
+            await pilot.press("tab")
+            await pilot.press("right")
+            await pilot.press("down")
+            query.assert_not_called()
+
+            # one query for september, none for august again
+            date_picker.date = datetime.date(2022, 9, 1)
+            assert marked() == [1]
+            assert not day_labels[0].has_class("--marker-birthday")
+            assert day_labels[3].has_class("--marker-event")
+            date_picker.date = datetime.date(2022, 8, 1)
+            assert marked() == [1, 15]
+            assert query.call_count == 1
+
+        date_picker.markers = None
+        assert marked() == []
+
+
+@pytest.mark.asyncio
+async def test_async_providers():
+    requests = []
+    responses = {}
+
+    class SlowMarkers(MarkerProvider):
+        async def markers(self, start, end):
+            requests.append((start.year, start.month))
+            response = responses.setdefault(
+                (start.year, start.month), asyncio.get_running_loop().create_future())
+            await response
+            return [(start, "event")]
+
+    async def disabled_dates(start, end):
+        return [end]
+
+    class AsyncApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(markers=SlowMarkers(), date_adapter=DateAdapter(),
+                           constraints=DateConstraints(disabled_dates=disabled_dates),
+                           clock=FixedClock(datetime.date(2022, 8, 4))),
+            )
+    app = AsyncApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        day_labels = date_picker.day_container.children
+        await pilot.pause()
+
+        # the days are shown, the markers are still loading
+        assert day_labels[0].day == 1
+        assert not day_labels[0].has_class("--marked")
+        # the current month and the adjacent ones are requested
+        assert sorted(requests) == [(2022, 7), (2022, 8), (2022, 9)]
+        # disabled dates are already loaded
+        assert day_labels[30].has_class("--disabled")
+
+        responses[(2022, 8)].set_result(None)
+        await pilot.pause()
+        assert day_labels[0].has_class("--marked")
+
+        # paging on: the prefetched september is marked when it resolves,
+        # the load of july is cancelled
+        date_picker.date = datetime.date(2022, 9, 1)
+        await pilot.pause()
+        assert responses[(2022, 7)].cancelled()
+        assert (2022, 10) in requests
+        responses[(2022, 9)].set_result(None)
+        await pilot.pause()
+        assert day_labels[3].has_class("--marked")
+
+        # a stale load doesn't change another month
+        date_picker.date = datetime.date(2022, 8, 1)
+        assert day_labels[0].has_class("--marked")
+        assert day_labels[30].has_class("--disabled")
+
+
+@pytest.mark.asyncio
+async def test_zoom_views():
+    class ZoomApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 4))),
+            )
+    app = ZoomApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        month_header = date_picker.month_header
+        assert date_picker.zoom_view is None
+
+        await pilot.click(MonthHeader)
+        await pilot.pause()
+        zoom_grid = date_picker.zoom_view.zoom_grid
+        assert date_picker.zoom == "year"
+        assert month_header.renderable == Text("2022")
+        assert zoom_grid.items[0] == "Jan"
+        assert zoom_grid.current == zoom_grid.cursor == 7
+        assert app.focused is zoom_grid
+        assert not date_picker.day_container.display
+
+        await pilot.click(MonthHeader)
+        assert date_picker.zoom == "decade"
+        assert month_header.renderable == Text("2020-2029")
+        assert zoom_grid.items[0] == "2019"
+        assert zoom_grid.items[zoom_grid.cursor] == "2022"
+
+        # three decades back and one forward: 2022 -> 1992 -> 2002
+        await pilot.press("pageup")
+        await pilot.press("pageup")
+        await pilot.press("pageup")
+        assert zoom_grid.items[0] == "1989"
+        await pilot.press("pagedown")
+        assert month_header.renderable == Text("2000-2009")
+        assert zoom_grid.items[zoom_grid.cursor] == "2002"
+
+        # select 2001
+        await pilot.press("left")
+        await pilot.press("enter")
+        assert date_picker.zoom == "year"
+        assert month_header.renderable == Text("2001")
+        assert zoom_grid.current is None
+
+        # february 2001, with one update of the days
+        with mock.patch.object(DatePicker, "_update_day_widgets", autospec=True,
+                               side_effect=DatePicker._update_day_widgets) as update:
+            await pilot.press("right")
+            await pilot.press("enter")
+            await pilot.pause()
+        update.assert_called_once()
+        assert date_picker.zoom == "month"
+        assert date_picker.date == datetime.date(2001, 2, 1)
+        assert date_picker.day_container.display
+        assert month_header.renderable == Text("February\n2001")
+        assert date_picker.focused_date == datetime.date(2001, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_go_to_input():
+    class ZoomApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(date_adapter=DateAdapter(), day_grid=True,
+                           clock=FixedClock(datetime.date(2022, 8, 4))),
+            )
+    app = ZoomApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        await pilot.click(MonthHeader)
+        await pilot.pause()
+
+        date_picker.zoom_view.go_to_input.focus()
+        await pilot.pause()
+        for key in "1975-13":
+            await pilot.press(key)
+        await pilot.press("enter")
+        # not a date, still zoomed
+        assert date_picker.zoom == "year"
+
+        date_picker.zoom_view.go_to_input.value = "1975-04-19"
+        await pilot.press("enter")
+        await pilot.pause()
+        assert date_picker.zoom == "month"
+        assert date_picker.date == datetime.date(1975, 4, 1)
+        assert date_picker.focused_date == datetime.date(1975, 4, 19)
+        assert date_picker.zoom_view.go_to_input.value == ""
+
+        # escape leaves the zoom view
+        await pilot.click(MonthHeader)
+        await pilot.press("escape")
+        assert date_picker.zoom == "month"
+        assert date_picker.date == datetime.date(1975, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_locale_and_firstweekday():
+    class LocaleApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(date_adapter=DateAdapter(), locale="de", firstweekday=6,
+                           clock=FixedClock(datetime.date(2023, 3, 15))),
+            )
+    app = LocaleApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        weekdays = [str(label.renderable) for label in date_picker.weekday_container.children]
+        assert weekdays[:2] == ["So", "Mo"]
+        assert date_picker.month_header.renderable == Text("März\n2023")
+        # march 2023 starts on a wednesday, the 4th column from sunday
+        assert date_picker.day_container.children[3].day == 1
+
+        date_picker.date = datetime.date(2023, 4, 1)
+        await pilot.pause()
+        assert date_picker.month_header.renderable == Text("April\n2023")
+        # the title of a shown month is looked up, not formatted again
+        with mock.patch("textual_datepicker._format.format_date") as format_date:
+            date_picker.date = datetime.date(2023, 3, 1)
+            await pilot.pause()
+        format_date.assert_not_called()
+        assert date_picker.month_header.renderable == Text("März\n2023")
+
+        await pilot.click(MonthHeader)
+        assert date_picker.zoom_view.zoom_grid.items[2] == "März"
+
+
+@pytest.mark.asyncio
+async def test_day_grid_reuses_rendered_lines():
+    class GridApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(date_adapter=DateAdapter(), day_grid=True,
+                           clock=FixedClock(datetime.date(2022, 8, 15))),
+            )
+    app = GridApp()
+
+    async with app.run_test() as pilot:
+        date_picker = app.query_one(DatePicker)
+        day_grid = date_picker.day_grid
+        date_picker.date = datetime.date(2022, 9, 1)
+        await pilot.pause()
+        date_picker.date = datetime.date(2022, 8, 1)
+        await pilot.pause()
+
+        with mock.patch.object(DayGrid, "_render_row", autospec=True,
+                               side_effect=DayGrid._render_row) as render_row:
+            # both months were shown already
+            date_picker.date = datetime.date(2022, 9, 1)
+            await pilot.pause()
+            date_picker.date = datetime.date(2022, 8, 1)
+            await pilot.pause()
+            render_row.assert_not_called()
+
+            # a new day: only the rows of the old and the new today
+            day_grid.update(day_grid.days, day_grid.today_index + 1)
+            await pilot.pause()
+            assert {call.args[1] for call in render_row.call_args_list} == {2}
+
+            # another theme renders all lines again
+            render_row.reset_mock()
+            app.dark = not app.dark
+            await pilot.pause()
+            assert {call.args[1] for call in render_row.call_args_list} == set(range(6))
+
+        assert len(day_grid._strips) <= DayGrid.STRIP_CACHE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_focus_skips_disabled_days():
+    # saturday the 6th is today, no weekends and no 5th of september
+    constraints = DateConstraints(
+        disabled_weekdays=[5, 6], holidays=[datetime.date(2022, 9, 5)])
+
+    class ConstraintsApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 6))),
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2022, 8, 6)),
+                           day_grid=True),
+            )
+    app = ConstraintsApp()
+
+    async with app.run_test() as pilot:
+        date_picker, grid_picker = app.query(DatePicker)
+        day_labels = date_picker.day_container.children
+        assert not day_labels[5].can_focus
+        assert day_labels[4].can_focus
+
+        for picker in (date_picker, grid_picker):
+            # a disabled today: the next selectable day
+            picker.focus_default_day()
+            await pilot.pause()
+            assert picker.focused_date == datetime.date(2022, 8, 8)
+
+            # home goes to the same day
+            picker._focus_index(2)
+            await pilot.pause()
+            await pilot.press("home")
+            assert picker.focused_date == datetime.date(2022, 8, 8)
+
+            # the 8th of august has the index of the 5th of september, the
+            # cursor moves to the 6th
+            await pilot.press("pagedown")
+            await pilot.pause()
+            assert picker.focused_date == datetime.date(2022, 9, 6)
+
+
+@pytest.mark.asyncio
+async def test_go_to_skips_disabled_days():
+    # the 1st of april 2023 is a saturday
+    constraints = DateConstraints(disabled_weekdays=[5, 6])
+
+    class ConstraintsApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2023, 1, 10))),
+                DatePicker(constraints=constraints, date_adapter=DateAdapter(),
+                           clock=FixedClock(datetime.date(2023, 1, 10)),
+                           day_grid=True),
+            )
+    app = ConstraintsApp()
+
+    async with app.run_test() as pilot:
+        for picker in app.query(DatePicker):
+            # april in the year view
+            await picker.show_zoom("year")
+            picker.zoom_view.zoom_grid.focus()
+            await pilot.pause()
+            picker.post_message(
+                ZoomGrid.Selected(picker.zoom_view.zoom_grid, 3))
+            await pilot.pause()
+            assert picker.zoom == "month"
+            assert picker.focused_date == datetime.date(2023, 4, 3)
+            assert picker.model.cursor_date == datetime.date(2023, 4, 3)
+            if picker.day_grid is None:
+                assert isinstance(app.focused, DayLabel)
@@ -1,11 +1,15 @@
+import datetime
+from unittest import mock
+
 import pytest
 import pendulum
 
 from textual.app import App, ComposeResult
 from textual.containers import Container
+from textual.css.query import NoMatches
 from textual.widget import events
 
-from textual_datepicker import DateSelect, DatePicker
+from textual_datepicker import DateSelect, DatePicker, DateAdapter, DateConstraints, Metrics
 
 
 @pytest.mark.asyncio
@@ -223,3 +227,412 @@ async def test_open_click():
                              shift=False, meta=False, ctrl=False)
         await app.post_message(click)
         await pilot.press("tab")
+
+@pytest.mark.asyncio
+async def test_shared_dialog():
+    """All DateSelects on the same mount share one dialog."""
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", shared_dialog=True),
+                DateSelect(picker_mount="#main_container", shared_dialog=True),
+                DateSelect(picker_mount="#main_container", shared_dialog=True),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        assert len(app.query(DatePicker)) == 1
+        first, second, third = app.query(DateSelect)
+        assert first.dialog is second.dialog is third.dialog
+
+        await pilot.press("tab")
+        await pilot.press("tab")
+        await pilot.press("enter")
+        assert second.dialog.display is True
+        assert second.dialog.target is second
+
+        await pilot.press("enter")
+        assert second.dialog.display is False
+        # the local today, as UTC date of the default adapter
+        today = pendulum.today()
+        assert second.date == pendulum.datetime(today.year, today.month, today.day)
+        assert first.date is None
+        assert third.date is None
+        assert app.focused is second
+
+@pytest.mark.asyncio
+async def test_lazy_dialog():
+    """The dialog is mounted on first open and removed after being idle."""
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", lazy_dialog=True,
+                           dialog_idle_timeout=0.1),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        date_select = app.query_one(DateSelect)
+        assert date_select.dialog is None
+        assert len(app.query(DatePicker)) == 0
+
+        await pilot.press("tab")
+        await pilot.press("enter")
+        assert len(app.query(DatePicker)) == 1
+        assert date_select.dialog.display is True
+        assert app.focused.day == pendulum.today().day
+
+        await pilot.press("enter")
+        assert date_select.dialog.display is False
+        # the local today, as UTC date of the default adapter
+        today = pendulum.today()
+        assert date_select.date == pendulum.datetime(today.year, today.month, today.day)
+
+        await pilot.pause(0.3)
+        assert len(app.query(DatePicker)) == 0
+
+        # opens again with a new dialog
+        await pilot.press("enter")
+        assert len(app.query(DatePicker)) == 1
+        assert date_select.dialog.display is True
+        assert app.focused.day == pendulum.today().day
+
+
+@pytest.mark.asyncio
+async def test_date_adapter():
+    date = datetime.date(2022, 4, 1)
+
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", date=date,
+                           format="DD.MM.YYYY", date_adapter=DateAdapter()),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        date_select = app.query_one(DateSelect)
+        assert "01.04.2022" in date_select.render()
+
+        await pilot.press("tab")
+        await pilot.press("enter")
+        await pilot.press("right")
+        await pilot.press("enter")
+        assert date_select.date == datetime.date(2022, 4, 2)
+        assert type(date_select.date) is datetime.date
+        assert "02.04.2022" in date_select.render()
+
+
+@pytest.mark.asyncio
+async def test_metrics():
+    metrics = Metrics()
+
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", metrics=metrics),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        await pilot.press("tab")
+        await pilot.press("enter")
+        await pilot.press("right")
+        await pilot.press("left")
+        await pilot.press("pagedown")
+        await pilot.press("enter")
+
+        assert metrics.counts["compose"] == 1
+        assert metrics.counts["dialog_show"] == 1
+        assert metrics.counts["dialog_hide"] >= 1
+        assert metrics.counts["handle_right"] == 1
+        assert metrics.counts["handle_left"] == 1
+        assert metrics.counts["watch_date"] >= 1
+        assert metrics.counts["update_day_widgets"] >= 1
+        assert metrics.counts["day_render"] > 0
+
+
+@pytest.mark.asyncio
+async def test_shared_dialog_without_date():
+    """A DateSelect without a date opens a shared dialog on today, not on the
+    month of the previous DateSelect, and without its selection."""
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", shared_dialog=True,
+                           date=datetime.date(2020, 5, 10),
+                           date_adapter=DateAdapter()),
+                DateSelect(picker_mount="#main_container", shared_dialog=True,
+                           date_adapter=DateAdapter()),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        first, second = app.query(DateSelect)
+        date_picker = app.query_one(DatePicker)
+
+        await pilot.press("tab")
+        await pilot.press("enter")
+        await pilot.pause()
+        assert date_picker.focused_date == datetime.date(2020, 5, 10)
+        await pilot.press("enter")
+        assert date_picker.selected_date == datetime.date(2020, 5, 10)
+
+        second.focus()
+        await pilot.pause()
+        await pilot.press("enter")
+        await pilot.pause()
+        today = datetime.date.today()
+        assert (date_picker.date.year, date_picker.date.month) == (today.year, today.month)
+        assert date_picker.focused_date == today
+        assert date_picker.selected_date is None
+        assert date_picker.model.selection is None
+
+
+@pytest.mark.asyncio
+async def test_constraints_with_shared_dialog():
+    """A shared dialog uses the constraints of the opening DateSelect."""
+    no_weekends = DateConstraints(disabled_weekdays=[5, 6])
+
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", shared_dialog=True,
+                           date=datetime.date(2022, 8, 1),
+                           constraints=no_weekends),
+                DateSelect(picker_mount="#main_container", shared_dialog=True,
+                           date=datetime.date(2022, 8, 1)),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        first, second = app.query(DateSelect)
+        date_picker = app.query_one(DatePicker)
+
+        await pilot.press("tab")
+        await pilot.press("enter")
+        assert date_picker.constraints is no_weekends
+        assert len(date_picker.query("DayLabel.--disabled")) == 8
+
+        second.focus()
+        await pilot.pause()
+        await pilot.press("enter")
+        assert date_picker.constraints is None
+        assert len(date_picker.query("DayLabel.--disabled")) == 0
+
+
+@pytest.mark.asyncio
+async def test_stored_date_on_disabled_day():
+    """A date which became disabled focuses the nearest selectable day."""
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container",
+                           date=datetime.date(2022, 8, 6),
+                           date_adapter=DateAdapter(),
+                           constraints=DateConstraints(disabled_weekdays=[5, 6])),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        await pilot.press("tab")
+        await pilot.press("enter")
+        await pilot.pause()
+        assert app.query_one(DatePicker).focused_date == datetime.date(2022, 8, 8)
+
+
+@pytest.mark.asyncio
+async def test_editable():
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", editable=True,
+                           date_adapter=DateAdapter()),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        date_select = app.query_one(DateSelect)
+        date_picker = app.query_one(DatePicker)
+        await pilot.press("tab")
+
+        with mock.patch.object(DatePicker, "watch_date", autospec=True,
+                               side_effect=DatePicker.watch_date) as watch_date:
+            for key in "2022-0":
+                await pilot.press(key)
+            assert date_select.dialog.display is False
+            assert date_select.render().startswith("2022-0 ")
+
+            # a month is typed: the dialog shows it, the focus stays
+            await pilot.press("8")
+            assert date_select.dialog.display is True
+            assert date_picker.date == datetime.date(2022, 8, 1)
+            assert app.focused is date_select
+
+            # typing the day doesn't touch the picker
+            for key in "-15":
+                await pilot.press(key)
+            assert watch_date.call_count == 1
+
+        await pilot.press("enter")
+        assert date_select.date == datetime.date(2022, 8, 15)
+        assert date_select.dialog.display is False
+        assert date_select.render().startswith("2022-08-15 ")
+
+        # invalid text shows an error and is discarded
+        for key in "2022-13":
+            await pilot.press(key)
+        assert date_select.has_class("-invalid")
+        await pilot.press("backspace")
+        assert not date_select.has_class("-invalid")
+        await pilot.press("escape")
+        assert date_select.date == datetime.date(2022, 8, 15)
+        assert date_select.render().startswith("2022-08-15 ")
+
+        # the format matches, but it is not a date
+        for key in "2022-02-31":
+            await pilot.press(key)
+        assert date_select.has_class("-invalid")
+        await pilot.press("enter")
+        assert date_select.has_class("-invalid")
+        assert date_select.render().startswith("2022-02-31 ")
+        for key in ("backspace", "backspace", "2", "8"):
+            await pilot.press(key)
+        assert not date_select.has_class("-invalid")
+        await pilot.press("enter")
+        assert date_select.date == datetime.date(2022, 2, 28)
+
+        # there is no year 0
+        for key in "0000-01":
+            await pilot.press(key)
+        assert date_select.has_class("-invalid")
+        await pilot.press("escape")
+        assert date_select.date == datetime.date(2022, 2, 28)
+
+        # enter without typing opens the picker
+        await pilot.press("enter")
+        assert date_select.dialog.display is True
+        assert app.focused.day == 28
+
+
+@pytest.mark.asyncio
+async def test_dialog_stays_open_while_moving_in_it():
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container"),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        date_select = app.query_one(DateSelect)
+        await pilot.press("tab")
+        await pilot.press("enter")
+        dialog = date_select.dialog
+        assert dialog.display is True
+        assert dialog.focus_within
+
+        with mock.patch.object(dialog, "query", wraps=dialog.query) as query:
+            for key in ("right", "down", "left", "up", "pagedown"):
+                await pilot.press(key)
+            assert dialog.display is True
+            query.assert_not_called()
+
+        date_select.focus()
+        await pilot.pause()
+        assert not dialog.focus_within
+        assert dialog.display is False
+
+
+@pytest.mark.asyncio
+async def test_reopen_without_queries():
+    date = pendulum.datetime(2022, 4, 19)
+
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", date=date),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        date_select = app.query_one(DateSelect)
+        await pilot.press("tab")
+        await pilot.press("enter")
+        assert app.focused.day == 19
+        date_select.focus()
+        await pilot.pause()
+        date_select.date = pendulum.datetime(2022, 6, 3)
+
+        with mock.patch.object(app, "query_one", wraps=app.query_one) as app_query, \
+                mock.patch.object(date_select.dialog, "query",
+                                  wraps=date_select.dialog.query) as dialog_query:
+            await pilot.press("enter")
+            await pilot.pause()
+        app_query.assert_not_called()
+        dialog_query.assert_not_called()
+        assert date_select.dialog.display is True
+        assert date_select.dialog.date_picker.date == pendulum.datetime(2022, 6, 1)
+        assert app.focused.day == 3
+
+
+@pytest.mark.asyncio
+async def test_missing_picker_mount():
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#missing", lazy_dialog=True),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test():
+        date_select = app.query_one(DateSelect)
+        with pytest.raises(NoMatches, match="picker_mount '#missing' matches no widget"):
+            date_select._picker_mount_widget()
+
+        date_select.picker_mount = "#main_container"
+        assert date_select._picker_mount_widget() is app.query_one("#main_container")
+
+
+@pytest.mark.asyncio
+async def test_shared_dialog_uses_adapter_and_metrics_of_opener():
+    metrics = Metrics()
+
+    class OpenDateSelectApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                DateSelect(picker_mount="#main_container", shared_dialog=True),
+                DateSelect(picker_mount="#main_container", shared_dialog=True,
+                           date_adapter=DateAdapter(), metrics=metrics),
+                id="main_container"
+            )
+
+    app = OpenDateSelectApp()
+    async with app.run_test() as pilot:
+        first, second = app.query(DateSelect)
+        assert first.dialog is second.dialog
+
+        await pilot.press("tab")
+        await pilot.press("tab")
+        await pilot.press("enter")
+        await pilot.press("enter")
+        assert type(second.date) is datetime.date
+        assert metrics.counts.get("dialog_show") == 1
+        assert metrics.counts.get("day_render", 0) > 0
+
+        first.focus()
+        await pilot.press("enter")
+        await pilot.press("enter")
+        assert isinstance(first.date, pendulum.DateTime)
+        assert metrics.counts.get("dialog_show") == 1
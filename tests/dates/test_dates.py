@@ -0,0 +1,193 @@
+import contextlib
+import datetime
+import locale
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import pendulum
+
+from textual_datepicker._dates import (
+    DateAdapter,
+    PendulumAdapter,
+    add_months,
+    get_date_adapter,
+    set_date_adapter,
+)
+from textual_datepicker._format import (
+    DateParser,
+    _calendar_names,
+    calendar_names,
+    compile_format,
+    format_date,
+)
+
+
+class FormatCases(unittest.TestCase):
+    def test_same_as_pendulum(self):
+        formats = ["YYYY-MM-DD", "MM/DD/YYYY", "D.M.YY", "MMMM\nYYYY",
+                   "ddd, MMM Do YYYY", "dddd [the] Do", "dd D"]
+        date = datetime.date(2023, 2, 1)
+        for day in range(1, 29):
+            date = date.replace(day=day)
+            for format in formats:
+                assert format_date(date, format) == pendulum.datetime(
+                    date.year, date.month, date.day).format(format)
+
+    def test_compile_format(self):
+        assert compile_format("YYYY-MM-DD") == ("YYYY", "-", "MM", "-", "DD")
+        assert compile_format("[at] D") == ("at", " ", "D")
+
+
+class CalendarNamesCases(unittest.TestCase):
+    def test_default(self):
+        names = calendar_names(firstweekday=0)
+        assert names.weekdays == ("Mo", "Tu", "We", "Th", "Fr", "Sa", "Su")
+        assert names.month_names[8] == "August"
+        assert calendar_names(firstweekday=6).weekdays[0] == "Su"
+
+    def test_cached(self):
+        assert calendar_names("de", 0) is calendar_names("de", 0)
+        assert calendar_names("de", 0) is not calendar_names("de", 6)
+
+    def test_locale_same_as_pendulum(self):
+        names = calendar_names("de", 0)
+        assert names.weekdays == ("Mo", "Di", "Mi", "Do", "Fr", "Sa", "So")
+        date = datetime.date(2023, 3, 1)
+        for format in ["MMMM\nYYYY", "MMM YYYY", "dddd, D. MMMM"]:
+            assert format_date(date, format, names) == pendulum.datetime(
+                2023, 3, 1).format(format, locale="de")
+
+    def test_month_title(self):
+        names = calendar_names("de", 0)
+        date = datetime.date(2023, 3, 15)
+        assert names.month_title(date, "MMMM\nYYYY") == "März\n2023"
+        assert names.month_title(date, "MMMM\nYYYY") is names.month_title(
+            date.replace(day=1), "MMMM\nYYYY")
+
+    def test_system_locale_without_pendulum(self):
+        tried = []
+
+        @contextlib.contextmanager
+        def different_locale(name):
+            tried.append(name)
+            if name != "de_DE.UTF-8":
+                raise locale.Error("unsupported locale setting")
+            yield
+
+        _calendar_names.cache_clear()
+        try:
+            with mock.patch.dict(sys.modules, {"pendulum.locales.locale": None}), \
+                    mock.patch("calendar.different_locale", different_locale):
+                names = calendar_names("de", 0)
+                assert names.locale == "de"
+                assert tried == ["de", "de_DE.UTF-8"]
+                with self.assertRaises(ValueError):
+                    calendar_names("xx", 0)
+        finally:
+            _calendar_names.cache_clear()
+
+    def test_unknown_locale(self):
+        with self.assertRaises(ValueError):
+            calendar_names("xx")
+
+
+class AdapterCases(unittest.TestCase):
+    def test_date_adapter(self):
+        adapter = DateAdapter()
+        date = datetime.date(2022, 8, 1)
+        assert adapter.from_date(date) is date
+        assert adapter.format(date, "YYYY-MM-DD") == "2022-08-01"
+
+    def test_pendulum_adapter(self):
+        adapter = PendulumAdapter()
+        date = adapter.from_date(datetime.date(2022, 8, 1))
+        assert date == pendulum.datetime(2022, 8, 1)
+        assert adapter.format(date, "MMM Do") == "Aug 1st"
+        assert adapter.format(datetime.date(2022, 8, 1), "MMM Do") == "Aug 1st"
+        today = adapter.from_local_date(pendulum.today().date())
+        assert today == pendulum.today()
+        assert today.timezone_name == pendulum.local_timezone().name
+
+    def test_default_adapter(self):
+        adapter = get_date_adapter()
+        assert isinstance(adapter, PendulumAdapter)
+        try:
+            set_date_adapter(DateAdapter())
+            assert type(get_date_adapter()) is DateAdapter
+        finally:
+            set_date_adapter(adapter)
+
+    def test_add_months(self):
+        assert add_months(datetime.date(2022, 8, 15), 0) == datetime.date(2022, 8, 1)
+        assert add_months(datetime.date(2022, 8, 15), 5) == datetime.date(2023, 1, 1)
+        assert add_months(datetime.date(2022, 1, 31), -1) == datetime.date(2021, 12, 1)
+        assert add_months(datetime.date(2022, 8, 1), -20) == datetime.date(2020, 12, 1)
+
+
+class ImportCases(unittest.TestCase):
+    def test_import_is_lazy(self):
+        code = (
+            "import sys, textual_datepicker;"
+            "assert 'textual' not in sys.modules;"
+            "assert 'pendulum' not in sys.modules;"
+            "textual_datepicker.DateAdapter;"
+            "assert 'pendulum' not in sys.modules;"
+            "textual_datepicker.DatePicker;"
+            "assert 'textual' in sys.modules;"
+            "assert 'pendulum' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class DateParserCases(unittest.TestCase):
+    def test_partial(self):
+        parser = DateParser("YYYY-MM-DD")
+        assert parser.parse("") == (None, None, None, False)
+        assert parser.parse("202") == (None, None, None, False)
+        assert parser.parse("2022-0") == (2022, None, None, False)
+        assert parser.parse("2022-08") == (2022, 8, None, False)
+        assert parser.parse("2022-08-15") == (2022, 8, 15, True)
+        assert parser.parse("2022-08-15").date == datetime.date(2022, 8, 15)
+        assert parser.parse("2022-02-31").date is None
+
+    def test_invalid(self):
+        parser = DateParser("YYYY-MM-DD")
+        assert parser.parse("2022-13") is None
+        assert parser.parse("2022/") is None
+        assert parser.parse("2022-08-155") is None
+        assert parser.parse("x") is None
+        assert parser.parse("0000-01") is None
+
+    def test_formats(self):
+        assert DateParser("D.M.YY").parse("15.8.22").date == datetime.date(2022, 8, 15)
+        assert DateParser("D.M.YY").parse("3.1") == (None, None, 3, False)
+        assert DateParser("D.M.YY").parse("3.2") == (None, 2, 3, False)
+        parser = DateParser("MMM Do, YYYY")
+        assert parser.parse("Au") == (None, 8, None, False)
+        assert parser.parse("Aug 1s") == (None, 8, 1, False)
+        assert parser.parse("Aug 1st, 2022").date == datetime.date(2022, 8, 1)
+        parser = DateParser("dddd, MMMM D YYYY")
+        assert parser.parse("Monday, August 1 2022").date == datetime.date(2022, 8, 1)
+
+    def test_same_as_format(self):
+        formats = ["YYYY-MM-DD", "MM/DD/YYYY", "D.M.YY", "ddd, MMM Do YYYY"]
+        date = datetime.date(2023, 1, 1)
+        for days in range(0, 365, 7):
+            day = date + datetime.timedelta(days=days)
+            for format in formats:
+                parser = DateParser(format)
+                assert parser.parse(format_date(day, format)).date == day
+
+    def test_incremental(self):
+        parser = DateParser("YYYY-MM-DD")
+        parser.parse("2022-08-15")
+        with mock.patch.object(DateParser, "_parse_part",
+                               wraps=DateParser._parse_part) as parse_part:
+            # only the day is parsed again
+            assert parser.parse("2022-08-16") == (2022, 8, 16, True)
+            assert parse_part.call_count == 1
+            # after a change of the month, month and day
+            assert parser.parse("2022-09-16") == (2022, 9, 16, True)
+            assert parse_part.call_count == 4
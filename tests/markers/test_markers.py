@@ -0,0 +1,78 @@
+import asyncio
+import datetime
+import unittest
+from unittest import mock
+
+from textual_datepicker._markers import MarkerIndex, MarkerProvider
+
+
+class MarkerIndexCases(unittest.TestCase):
+    def test_month_markers(self):
+        index = MarkerIndex([
+            (datetime.date(2022, 7, 31), "event"),
+            (datetime.date(2022, 8, 1), "event"),
+            (datetime.date(2022, 8, 1), "birthday"),
+            (datetime.date(2022, 8, 31), "event"),
+            (datetime.date(2022, 9, 1), "event"),
+        ])
+        assert len(index) == 5
+        assert index.month_markers(2022, 8) == {
+            1: frozenset({"event", "birthday"}),
+            31: frozenset({"event"}),
+        }
+        assert index.month_markers(2022, 10) == {}
+
+    def test_many_entries(self):
+        start = datetime.date(2000, 1, 1)
+        index = MarkerIndex(
+            (start + datetime.timedelta(days=days), "event")
+            for days in range(0, 20000, 2)
+        )
+        markers = index.month_markers(2022, 8)
+        assert sorted(markers) == [
+            day for day in range(1, 32)
+            if (datetime.date(2022, 8, day) - start).days % 2 == 0
+        ]
+
+    def test_cached_per_month(self):
+        index = MarkerIndex([(datetime.date(2022, 8, 1), "event")])
+        with mock.patch.object(index, "markers", wraps=index.markers) as markers:
+            index.month_markers(2022, 8)
+            index.month_markers(2022, 8)
+            markers.assert_called_once_with(
+                datetime.date(2022, 8, 1), datetime.date(2022, 8, 31))
+
+            index.clear_cache()
+            index.month_markers(2022, 8)
+            assert markers.call_count == 2
+
+    def test_cache_size(self):
+        index = MarkerIndex(cache_size=2)
+        for month in (1, 2, 3):
+            index.month_markers(2022, month)
+        assert list(index._cache) == [(2022, 2), (2022, 3)]
+
+    def test_provider(self):
+        class Provider(MarkerProvider):
+            def markers(self, start, end):
+                return [(start, "first"), (end, "last")]
+
+        assert Provider().month_markers(2022, 2) == {
+            1: frozenset({"first"}),
+            28: frozenset({"last"}),
+        }
+
+    def test_async_provider(self):
+        class Provider(MarkerProvider):
+            async def markers(self, start, end):
+                return [(start, "first")]
+
+        provider = Provider()
+        assert provider.is_async
+        assert provider.needs_load(2022, 8)
+        assert provider.month_markers(2022, 8) == {}
+
+        asyncio.run(provider.load_month(2022, 8))
+        assert not provider.needs_load(2022, 8)
+        assert provider.month_markers(2022, 8) == {1: frozenset({"first"})}
+        assert not MarkerIndex().needs_load(2022, 8)
@@ -0,0 +1,45 @@
+import unittest
+
+from textual_datepicker import Metrics
+from textual_datepicker._metrics import timed
+
+
+class Instrumented:
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+
+    @timed("add")
+    def add(self, a, b):
+        return a + b
+
+    @timed("compose")
+    def compose(self):
+        yield 1
+        yield 2
+
+
+class MetricsCases(unittest.TestCase):
+    def test_record(self):
+        calls = []
+        metrics = Metrics(callback=lambda name, duration: calls.append(name))
+        metrics.record("update", 0.5)
+        metrics.record("update", 1.5)
+
+        assert calls == ["update", "update"]
+        assert metrics.summary() == {
+            "update": {"count": 2, "total": 2.0, "average": 1.0}
+        }
+        metrics.reset()
+        assert metrics.summary() == {}
+
+    def test_timed(self):
+        metrics = Metrics()
+        instrumented = Instrumented(metrics)
+        assert instrumented.add(1, 2) == 3
+        assert list(instrumented.compose()) == [1, 2]
+        assert metrics.counts == {"add": 1, "compose": 1}
+
+    def test_timed_disabled(self):
+        instrumented = Instrumented()
+        assert instrumented.add(1, 2) == 3
+        assert list(instrumented.compose()) == [1, 2]
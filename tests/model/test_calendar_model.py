@@ -0,0 +1,207 @@
+import datetime
+import random
+import unittest
+
+from textual_datepicker._constraints import DateConstraints
+from textual_datepicker._model import CalendarModel, fallback_index
+
+
+def model_at(date, **kwargs):
+    """A model with the cursor on date, mondays first."""
+    model = CalendarModel(date, firstweekday=0, **kwargs)
+    model.cursor = model.index_of(date)
+    return model
+
+
+class NavigationCases(unittest.TestCase):
+    def test_left_right(self):
+        # 2022-08-01 is a monday
+        model = model_at(datetime.date(2022, 8, 2))
+        model.left()
+        assert model.cursor_date == datetime.date(2022, 8, 1)
+        model.right()
+        assert model.cursor_date == datetime.date(2022, 8, 2)
+
+    def test_left_nudges_to_previous_month(self):
+        model = model_at(datetime.date(2022, 8, 1))
+        model.left()
+        assert model.month == datetime.date(2022, 7, 1)
+        # july starts on a friday, index 0 is empty: to the 2nd row
+        assert model.cursor == fallback_index(1) == 7
+        assert model.cursor_date == datetime.date(2022, 7, 4)
+
+    def test_right_nudges_to_next_month(self):
+        # sunday at the end of a week
+        model = model_at(datetime.date(2022, 8, 7))
+        model.right()
+        # the cursor keeps its index
+        assert model.month == datetime.date(2022, 9, 1)
+        assert model.cursor == 6
+        assert model.cursor_date == datetime.date(2022, 9, 4)
+
+        # last day of the month
+        model = model_at(datetime.date(2022, 8, 31))
+        model.right()
+        assert model.month == datetime.date(2022, 9, 1)
+        assert model.cursor_date == datetime.date(2022, 9, 28)
+
+        # its index is empty in november: to the end of the 4th row
+        model = model_at(datetime.date(2022, 10, 31))
+        model.right()
+        assert model.month == datetime.date(2022, 11, 1)
+        assert model.cursor == fallback_index(31) == 27
+        assert model.cursor_date == datetime.date(2022, 11, 27)
+
+    def test_up_down(self):
+        model = model_at(datetime.date(2022, 8, 3))
+        model.up()
+        assert model.cursor_date == datetime.date(2022, 8, 3)
+        model.down()
+        assert model.cursor_date == datetime.date(2022, 8, 10)
+        model.down()
+        model.down()
+        model.down()
+        assert model.cursor_date == datetime.date(2022, 8, 31)
+        model.down()
+        assert model.cursor_date == datetime.date(2022, 8, 31)
+        assert model.month == datetime.date(2022, 8, 1)
+
+    def test_home(self):
+        model = model_at(datetime.date(2022, 8, 3))
+        model.home(datetime.date(2023, 2, 14))
+        assert model.month == datetime.date(2023, 2, 1)
+        assert model.cursor_date == datetime.date(2023, 2, 14)
+
+    def test_constraints_skip_disabled_days(self):
+        # no wednesdays
+        constraints = DateConstraints(disabled_weekdays=[2])
+        model = model_at(datetime.date(2022, 8, 2), constraints=constraints)
+        model.right()
+        assert model.cursor_date == datetime.date(2022, 8, 4)
+        model.left()
+        assert model.cursor_date == datetime.date(2022, 8, 2)
+        assert model.disabled_days() & (1 << 2)
+        assert not model.disabled_days() & (1 << 3)
+
+    def test_month_change_skips_disabled_days(self):
+        constraints = DateConstraints(holidays=[datetime.date(2022, 9, 5)])
+        # the 8th of august has the index of the 5th of september
+        model = model_at(datetime.date(2022, 8, 8), constraints=constraints)
+        model.move_month(1)
+        assert model.cursor_date == datetime.date(2022, 9, 6)
+
+        # a disabled today: the nearest selectable day
+        model.home(datetime.date(2022, 9, 5))
+        assert model.cursor_date == datetime.date(2022, 9, 6)
+        assert model.enabled_index(7) == model.index_of(datetime.date(2022, 9, 6))
+
+        # nothing can be selected: the cursor stays
+        model.constraints = DateConstraints(max_date=datetime.date(2022, 1, 1))
+        assert model.enabled_index(10) is None
+        cursor = model.cursor
+        model.move_month(1)
+        assert model.cursor == cursor
+
+    def test_no_cursor(self):
+        model = CalendarModel(datetime.date(2022, 8, 1))
+        for move in (model.left, model.right, model.up, model.down):
+            move()
+        assert model.cursor is None
+        assert model.month == datetime.date(2022, 8, 1)
+
+    def test_cursor_on_empty_day(self):
+        # august 2022 ends at index 30, the moves put the cursor on the 31st
+        for move in ("left", "right", "up", "down", "move_days"):
+            model = model_at(datetime.date(2022, 8, 1))
+            model.cursor = 40
+            if move == "move_days":
+                model.move_days(1)
+            else:
+                getattr(model, move)()
+            assert model.cursor_date == datetime.date(2022, 8, 31), move
+
+    def test_move_days(self):
+        model = model_at(datetime.date(2022, 8, 31))
+        model.move_days(1)
+        assert model.cursor_date == datetime.date(2022, 9, 1)
+        model.move_days(-7)
+        assert model.cursor_date == datetime.date(2022, 8, 25)
+
+        # disabled days are skipped in steps of days
+        model.constraints = DateConstraints(holidays=[datetime.date(2022, 9, 1)])
+        model.move_days(7)
+        assert model.cursor_date == datetime.date(2022, 9, 8)
+
+        # nothing can be selected: the cursor stays
+        model.constraints = DateConstraints(max_date=datetime.date(2022, 1, 1))
+        model.move_days(1)
+        assert model.cursor_date == datetime.date(2022, 9, 8)
+
+    def test_random_walk(self):
+        """The cursor is always on a day of the displayed month, the days
+        change by the expected steps."""
+        rng = random.Random(4)
+        constraints = DateConstraints(disabled_weekdays=[6])
+        for firstweekday in (0, 6):
+            model = CalendarModel(datetime.date(2022, 8, 1),
+                                  constraints=constraints,
+                                  firstweekday=firstweekday)
+            model.cursor = model.layout.first_index
+            for _ in range(20000):
+                before, month = model.cursor_date, model.month
+                move = rng.choice(["left", "right", "up", "down"])
+                getattr(model, move)()
+                assert model.layout.is_day(model.cursor)
+                after = model.cursor_date
+                assert after.replace(day=1) == model.month
+                if model.month == month and after != before:
+                    assert model.is_enabled(after)
+                    days = (after - before).days
+                    assert {
+                        "left": days < 0, "right": days > 0,
+                        "up": days < 0 and days % 7 == 0,
+                        "down": days > 0 and days % 7 == 0,
+                    }[move]
+
+
+class SelectionCases(unittest.TestCase):
+    def test_select(self):
+        model = CalendarModel(
+            datetime.date(2022, 8, 1),
+            constraints=DateConstraints(holidays=[datetime.date(2022, 8, 15)]))
+        assert model.select(datetime.date(2022, 8, 14))
+        assert not model.select(datetime.date(2022, 8, 15))
+        assert model.selection == datetime.date(2022, 8, 14)
+        assert model.range_bounds() is None
+
+    def test_range(self):
+        model = CalendarModel(datetime.date(2022, 8, 1), select_range=True,
+                              firstweekday=0)
+        model.select(datetime.date(2022, 8, 10))
+        assert model.range_indexes() == range(9, 10)
+        assert model.preview(datetime.date(2022, 8, 5))
+        assert model.range_indexes() == range(4, 10)
+
+        # end in september, reversed start and end are ordered
+        model.select(datetime.date(2022, 9, 2))
+        assert model.range_complete
+        assert not model.preview(datetime.date(2022, 9, 20))
+        assert model.range_bounds() == (
+            datetime.date(2022, 8, 10), datetime.date(2022, 9, 2))
+        assert model.range_indexes() == range(9, 31)
+        model.move_month(1)
+        # september 2022 starts on a thursday
+        assert model.range_indexes() == range(3, 5)
+        model.move_month(1)
+        assert model.range_indexes() == range(0)
+
+        # a third date starts a new range
+        # october 2022 starts on a saturday
+        model.select(datetime.date(2022, 10, 3))
+        assert not model.range_complete
+        assert model.range_indexes() == range(7, 8)
+
+        model.clear_selection()
+        assert model.selection is None
+        assert model.range_bounds() is None
+        assert model.range_indexes() == range(0)
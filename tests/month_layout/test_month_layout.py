@@ -0,0 +1,40 @@
+import calendar
+import unittest
+
+from textual_datepicker._calendar import month_layout
+
+
+class MonthLayoutCases(unittest.TestCase):
+    def test_same_as_monthcalendar(self):
+        for year in (2022, 2023, 2024):
+            for month in range(1, 13):
+                for firstweekday in range(7):
+                    weeks = calendar.Calendar(firstweekday).monthdayscalendar(
+                        year, month)
+                    days = [day for week in weeks for day in week]
+                    days += [0] * (42 - len(days))
+
+                    layout = month_layout(year, month, firstweekday)
+                    assert layout.days == tuple(days)
+                    assert layout.days[layout.first_index] == 1
+                    assert layout.days[layout.last_index] == max(days)
+
+    def test_is_day(self):
+        # 2022-08-01 is a monday
+        layout = month_layout(2022, 8, 0)
+        assert layout.first_index == 0
+        assert layout.last_index == 30
+        assert layout.is_day(0)
+        assert layout.is_day(30)
+        assert not layout.is_day(31)
+        assert layout.index_of(31) == 30
+
+        layout = month_layout(2022, 8, 6)
+        assert layout.first_index == 1
+        assert not layout.is_day(0)
+
+    def test_cached(self):
+        assert month_layout(2023, 2, 0) is month_layout(2023, 2, 0)
+
+    def test_default_firstweekday(self):
+        assert month_layout(2023, 2) == month_layout(2023, 2, calendar.firstweekday())
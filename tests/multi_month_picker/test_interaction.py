@@ -0,0 +1,126 @@
+import datetime
+
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.containers import Container
+
+from textual_datepicker import MultiMonthPicker, DateAdapter
+from textual_datepicker._clock import FixedClock
+from textual_datepicker._date_picker import DayGrid
+from textual_datepicker._multi_month_picker import MonthPane
+
+
+def multi_month_app(**options):
+    class MultiMonthApp(App):
+        def compose(self) -> ComposeResult:
+            yield Container(
+                MultiMonthPicker(
+                    clock=FixedClock(datetime.date(2022, 8, 15)),
+                    date_adapter=DateAdapter(),
+                    **options
+                ),
+            )
+    return MultiMonthApp()
+
+
+@pytest.mark.asyncio
+async def test_panes_are_reused():
+    app = multi_month_app()
+
+    async with app.run_test() as pilot:
+        picker = app.query_one(MultiMonthPicker)
+        assert [pane.month for pane in picker.panes] == [
+            datetime.date(2022, 8, 1),
+            datetime.date(2022, 9, 1),
+            datetime.date(2022, 10, 1),
+        ]
+        assert picker.panes[0].day_grid.today_index == 14
+        widgets = len(app.query("*"))
+
+        for _ in range(12):
+            picker._move_month(1)
+        await pilot.pause()
+
+        assert len(app.query("*")) == widgets
+        assert len(app.query(MonthPane)) == 3
+        assert [pane.month for pane in picker.panes] == [
+            datetime.date(2023, 8, 1),
+            datetime.date(2023, 9, 1),
+            datetime.date(2023, 10, 1),
+        ]
+        assert picker.panes[0].day_grid.today_index is None
+
+
+@pytest.mark.asyncio
+async def test_year_view():
+    app = multi_month_app(months=12, columns=4)
+
+    async with app.run_test(size=(140, 70)) as pilot:
+        assert len(app.query(MonthPane)) == 12
+        assert len(app.query(DayGrid)) == 12
+        panes = app.query_one(".panes")
+        assert panes.styles.grid_size_columns == 4
+        regions = [pane.region for pane in app.query(MonthPane)]
+        assert [region.x for region in regions[:5]] == [0, 30, 60, 90, 0]
+        assert regions[4].y == regions[0].y + 15
+        assert all(region.width == 28 for region in regions)
+
+
+@pytest.mark.asyncio
+async def test_keys_across_panes():
+    app = multi_month_app()
+
+    async with app.run_test(size=(100, 30)) as pilot:
+        picker = app.query_one(MultiMonthPicker)
+
+        await pilot.press("tab")
+        await pilot.press("tab")
+        await pilot.press("tab")
+        assert picker.focused_date == datetime.date(2022, 8, 15)
+
+        await pilot.press("down")
+        await pilot.press("down")
+        await pilot.press("down")
+        assert picker.focused_date == datetime.date(2022, 9, 5)
+        assert app.focused is picker.panes[1].day_grid
+        assert picker.date == datetime.date(2022, 8, 1)
+
+        for _ in range(11):
+            await pilot.press("down")
+        assert picker.focused_date == datetime.date(2022, 11, 21)
+        # scrolled by one month
+        assert picker.date == datetime.date(2022, 9, 1)
+        assert app.focused is picker.panes[2].day_grid
+
+        await pilot.press("enter")
+        assert picker.selected_date == datetime.date(2022, 11, 21)
+
+        await pilot.press("home")
+        assert picker.date == datetime.date(2022, 8, 1)
+        assert picker.focused_date == datetime.date(2022, 8, 15)
+
+        await pilot.press("left")
+        await pilot.press("pageup")
+        assert picker.date == datetime.date(2022, 7, 1)
+
+
+@pytest.mark.asyncio
+async def test_today_moves_at_midnight():
+    class MidnightClock(FixedClock):
+        """Changes to the next month once."""
+        def seconds_until_tomorrow(self):
+            if self._today.day == 31:
+                self._today = datetime.date(2022, 9, 1)
+                return 0.05
+            return None
+
+    app = multi_month_app()
+
+    async with app.run_test() as pilot:
+        picker = app.query_one(MultiMonthPicker)
+        picker.clock = MidnightClock(datetime.date(2022, 8, 31))
+        picker._schedule_new_day()
+        await pilot.pause(0.2)
+        assert picker.panes[0].day_grid.today_index is None
+        assert picker.panes[1].day_grid.today_index == 3
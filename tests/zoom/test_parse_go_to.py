@@ -0,0 +1,21 @@
+import datetime
+import unittest
+
+from textual_datepicker._zoom import parse_go_to
+
+
+class ParseGoToCases(unittest.TestCase):
+    def test_full_date(self):
+        assert parse_go_to("1975-04-19") == datetime.date(1975, 4, 19)
+        assert parse_go_to(" 1975/4/9 ") == datetime.date(1975, 4, 9)
+
+    def test_partial_date(self):
+        assert parse_go_to("1975-04") == datetime.date(1975, 4, 1)
+        assert parse_go_to("1975") == datetime.date(1975, 1, 1)
+
+    def test_invalid(self):
+        assert parse_go_to("") is None
+        assert parse_go_to("75-04-19") is None
+        assert parse_go_to("1975-13") is None
+        assert parse_go_to("2023-02-29") is None
+        assert parse_go_to("april") is None
@@ -1,7 +1,59 @@
-from textual_datepicker._date_picker import DatePicker
-from textual_datepicker._date_select import DateSelect
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual_datepicker._date_picker import DatePicker
+    from textual_datepicker._date_select import DateSelect
+    from textual_datepicker._multi_month_picker import MultiMonthPicker
+    from textual_datepicker._constraints import DateConstraints
+    from textual_datepicker._markers import MarkerIndex, MarkerProvider
+    from textual_datepicker._dates import (
+        DateAdapter,
+        PendulumAdapter,
+        set_date_adapter,
+    )
+    from textual_datepicker._metrics import Metrics
 
 __all__ = [
     "DatePicker",
-    "DateSelect"
+    "DateSelect",
+    "MultiMonthPicker",
+    "DateConstraints",
+    "MarkerProvider",
+    "MarkerIndex",
+    "DateAdapter",
+    "PendulumAdapter",
+    "set_date_adapter",
+    "Metrics",
 ]
+
+# Attributes are imported on first access, so importing the package does not
+# import textual or pendulum.
+_lazy_attributes = {
+    "DatePicker": "textual_datepicker._date_picker",
+    "DateSelect": "textual_datepicker._date_select",
+    "MultiMonthPicker": "textual_datepicker._multi_month_picker",
+    "DateConstraints": "textual_datepicker._constraints",
+    "MarkerProvider": "textual_datepicker._markers",
+    "MarkerIndex": "textual_datepicker._markers",
+    "DateAdapter": "textual_datepicker._dates",
+    "PendulumAdapter": "textual_datepicker._dates",
+    "set_date_adapter": "textual_datepicker._dates",
+    "Metrics": "textual_datepicker._metrics",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import calendar
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class MonthLayout(NamedTuple):
+    """The days of a month in a grid of 6 rows with 7 days."""
+
+    # 42 days, 0 for the empty days before and after the month
+    days: tuple[int, ...]
+
+    # index of the first day of the month
+    first_index: int
+
+    # index of the last day of the month
+    last_index: int
+
+    def is_day(self, index: int) -> bool:
+        """True if index is a day of the month, not an empty day."""
+        return self.first_index <= index <= self.last_index
+
+    def index_of(self, day: int) -> int:
+        """The index of the given day of the month."""
+        return self.first_index + day - 1
+
+
+def month_layout(year: int, month: int, firstweekday: int | None = None) -> MonthLayout:
+    """The (cached) layout of a month. Without firstweekday, the one of the
+    calendar module is used."""
+    if firstweekday is None:
+        firstweekday = calendar.firstweekday()
+    return _month_layout(year, month, firstweekday)
+
+
+@lru_cache(maxsize=128)
+def _month_layout(year: int, month: int, firstweekday: int) -> MonthLayout:
+    weekday, days_in_month = calendar.monthrange(year, month)
+    first_index = (weekday - firstweekday) % 7
+    last_index = first_index + days_in_month - 1
+
+    days = (
+        (0,) * first_index
+        + tuple(range(1, days_in_month + 1))
+        + (0,) * (41 - last_index)
+    )
+
+    return MonthLayout(days, first_index, last_index)
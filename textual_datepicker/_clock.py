@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import datetime
+import time
+
+
+class Clock:
+    """Provides today's date, computed once and cached until local midnight."""
+
+    def __init__(self) -> None:
+        self._today: datetime.date | None = None
+        # timestamp of the next local midnight
+        self._expires = 0.0
+
+    def today(self) -> datetime.date:
+        """Today in the local timezone."""
+        now = time.time()
+        if self._today is None or now >= self._expires:
+            self._today = datetime.date.fromtimestamp(now)
+            tomorrow = self._today + datetime.timedelta(days=1)
+            self._expires = time.mktime(tomorrow.timetuple())
+        return self._today
+
+    def seconds_until_tomorrow(self) -> float | None:
+        """Seconds until today changes, None if it never changes."""
+        self.today()
+        return max(self._expires - time.time(), 0.0)
+
+
+class FixedClock(Clock):
+    """A clock which is stuck on one day, e.g. for tests and benchmarks."""
+
+    def __init__(self, date: datetime.date) -> None:
+        super().__init__()
+        self._today = datetime.date(date.year, date.month, date.day)
+
+    def today(self) -> datetime.date:
+        return self._today
+
+    def seconds_until_tomorrow(self) -> float | None:
+        return None
+
+
+_clock = Clock()
+
+
+def get_clock() -> Clock:
+    """The clock used by pickers without their own clock."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """Replace the clock used by pickers without their own clock."""
+    global _clock
+    _clock = clock
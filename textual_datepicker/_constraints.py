@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import calendar
+import datetime
+from typing import Awaitable, Callable, Iterable
+
+# async source of the disabled dates from a first to a last date
+DisabledDates = Callable[
+    [datetime.date, datetime.date], Awaitable[Iterable[datetime.date]]
+]
+
+
+def _as_date(date: datetime.date) -> datetime.date:
+    """A plain datetime.date, also for datetimes (e.g. pendulum)."""
+    return datetime.date(date.year, date.month, date.day)
+
+
+class DateConstraints:
+    """The dates which can be selected.
+
+    The constraints are compiled per month into a bitmask of the selectable
+    days (bit 0 is the 1st) and cached per (year, month). Rendering and
+    navigation only look at the bitmask, is_selectable is called once per day
+    and month.
+
+    disabled_dates is an async source (e.g. a database), called with the first
+    and the last day of a month. Its months are loaded in the background with
+    load_month(), until then their days are not disabled by it.
+
+    The constraints are read-only, create new ones to change them. If the
+    result of is_selectable changes, call clear_cache() and assign the
+    constraints to the picker again.
+    """
+
+    def __init__(
+        self,
+        min_date: datetime.date | None = None,
+        max_date: datetime.date | None = None,
+        disabled_weekdays: Iterable[int] = (),
+        holidays: Iterable[datetime.date] = (),
+        is_selectable: Callable[[datetime.date], bool] | None = None,
+        disabled_dates: DisabledDates | None = None,
+    ) -> None:
+        self._min_date = _as_date(min_date) if min_date is not None else None
+        self._max_date = _as_date(max_date) if max_date is not None else None
+        self._disabled_weekdays = frozenset(disabled_weekdays)
+        self._is_selectable = is_selectable
+        self._disabled_dates = disabled_dates
+        # the loaded disabled dates as bitmask per (year, month)
+        self._loaded: dict[tuple[int, int], int] = {}
+        # the holidays as bitmask of the disabled days per (year, month)
+        self._holidays: dict[tuple[int, int], int] = {}
+        for holiday in holidays:
+            key = (holiday.year, holiday.month)
+            self._holidays[key] = self._holidays.get(key, 0) | 1 << (holiday.day - 1)
+        # compiled bitmasks per (year, month)
+        self._masks: dict[tuple[int, int], int] = {}
+
+    @property
+    def min_date(self) -> datetime.date | None:
+        """The first selectable date."""
+        return self._min_date
+
+    @property
+    def max_date(self) -> datetime.date | None:
+        """The last selectable date."""
+        return self._max_date
+
+    @property
+    def disabled_weekdays(self) -> frozenset[int]:
+        """The weekdays which can't be selected, 0 is monday."""
+        return self._disabled_weekdays
+
+    @property
+    def is_selectable(self) -> Callable[[datetime.date], bool] | None:
+        """The custom check, called with a datetime.date."""
+        return self._is_selectable
+
+    @property
+    def disabled_dates(self) -> DisabledDates | None:
+        """The async source of disabled dates per month."""
+        return self._disabled_dates
+
+    def clear_cache(self) -> None:
+        """Forget the compiled and loaded months, e.g. after the source of
+        is_selectable or disabled_dates has changed."""
+        self._masks.clear()
+        self._loaded.clear()
+
+    def month_mask(self, year: int, month: int) -> int:
+        """Bitmask of the selectable days of the month, bit 0 is the 1st."""
+        key = (year, month)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = self._compile(year, month)
+        if self._loaded:
+            mask &= ~self._loaded.get(key, 0)
+        return mask
+
+    def needs_load(self, year: int, month: int) -> bool:
+        """True if the month has to be loaded with load_month()."""
+        return self.disabled_dates is not None and (year, month) not in self._loaded
+
+    async def load_month(self, year: int, month: int) -> None:
+        """Load the disabled dates of a month from disabled_dates."""
+        _, days_in_month = calendar.monthrange(year, month)
+        disabled = await self.disabled_dates(
+            datetime.date(year, month, 1), datetime.date(year, month, days_in_month))
+        mask = 0
+        for date in disabled:
+            mask |= 1 << (date.day - 1)
+        self._loaded[(year, month)] = mask
+
+    def is_enabled(self, date: datetime.date) -> bool:
+        """True if the date can be selected."""
+        return bool(self.month_mask(date.year, date.month) >> (date.day - 1) & 1)
+
+    def next_enabled(self, year: int, month: int, day: int, step: int) -> int | None:
+        """The next selectable day after day, going by step days (negative:
+        backwards). None if there is none in the month."""
+        mask = self.month_mask(year, month)
+        if step == 1:
+            following = mask >> day
+            if not following:
+                return None
+            return day + (following & -following).bit_length()
+        if step == -1:
+            preceding = mask & ((1 << (day - 1)) - 1)
+            return preceding.bit_length() or None
+
+        day += step
+        while 1 <= day <= 31:
+            if mask >> (day - 1) & 1:
+                return day
+            day += step
+        return None
+
+    def _compile(self, year: int, month: int) -> int:
+        weekday, days_in_month = calendar.monthrange(year, month)
+        mask = (1 << days_in_month) - 1
+
+        if self.min_date is not None:
+            if self.min_date > datetime.date(year, month, days_in_month):
+                return 0
+            if (self.min_date.year, self.min_date.month) == (year, month):
+                mask &= ~((1 << (self.min_date.day - 1)) - 1)
+
+        if self.max_date is not None:
+            if self.max_date < datetime.date(year, month, 1):
+                return 0
+            if (self.max_date.year, self.max_date.month) == (year, month):
+                mask &= (1 << self.max_date.day) - 1
+
+        for disabled_weekday in self.disabled_weekdays:
+            for index in range((disabled_weekday - weekday) % 7, days_in_month, 7):
+                mask &= ~(1 << index)
+
+        mask &= ~self._holidays.get((year, month), 0)
+
+        if self.is_selectable is not None:
+            for index in range(days_in_month):
+                if mask >> index & 1 and not self.is_selectable(
+                    datetime.date(year, month, index + 1)
+                ):
+                    mask &= ~(1 << index)
+
+        return mask
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
-import calendar
-import pendulum
+import asyncio
+import datetime
+from collections import OrderedDict
+from typing import Callable
+
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
 
 from textual.app import ComposeResult
+from textual.strip import Strip
+from textual.geometry import Region
 from textual.widget import Widget, RenderableType, events
-from textual.widgets import Static, Button
+from textual.widgets import Static, Button, Input
 from textual.containers import Vertical, Horizontal
 from textual.reactive import reactive
-from textual.css.query import NoMatches
 from textual.message import Message
 
+from ._calendar import MonthLayout
+from ._clock import Clock, get_clock
+from ._constraints import DateConstraints
+from ._dates import DateAdapter, add_months, get_date_adapter
+from ._format import CalendarNames, calendar_names
+from ._markers import MarkerProvider, MonthMarkers
+from ._metrics import Metrics, timed
+from ._model import CalendarModel, fallback_index
+from ._zoom import ZoomGrid, ZoomView, parse_go_to
+
 # from textual import log
 
 
@@ -46,24 +63,37 @@ class MonthHeader(Static):
 
     def __init__(
         self,
-        date: pendulum.DateTime,
+        date: datetime.date,
+        names: CalendarNames | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
     ) -> None:
         super().__init__(name=name, id=id, classes=classes)
-        self.renderable = date.format(self.format)
+        # the month names, the ones of the calendar module if None
+        self.names = names if names is not None else calendar_names()
+        self.renderable = self.names.month_title(date, self.format)
+
+    def update(self, date: datetime.date) -> None:
+        super().update(self.names.month_title(date, self.format))
+
+    def update_text(self, text: str) -> None:
+        """Show a text instead of a month, e.g. the year of the year view."""
+        super().update(text)
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "enter":
+            self.post_message(self.Selected(self))
 
-    def update(self, date: pendulum.DateTime) -> None:
-        super().update(date.format(self.format))
+    def on_click(self, _event: events.MouseEvent) -> None:
+        self.post_message(self.Selected(self))
 
-    # def on_key(self, event: events.Key) -> None:
-    #     if event.key == "enter":
-    #         self.emit_no_wait(self.Selected(self))
+    class Selected(Message):
+        """The MonthHeader was selected."""
 
-    # class Selected(Message):
-    #     """The MonthHeader was selected."""
-    #     pass
+        def __init__(self, sender: MonthHeader) -> None:
+            super().__init__()
+            self.sender = sender
 
 
 class WeekdayContainer(Horizontal):
@@ -79,65 +109,93 @@ class WeekdayLabel(Static):
 
 
 class DayLabel(Widget):
+    """A day of the month, 0 for an empty day in front of or after the month."""
+
     def __init__(
         self,
-        label: str,
+        label: int | str,
+        index: int | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
     ):
         super().__init__(name=name, id=id, classes=classes)
-        self.label = label
-        if int(label) == 0:
-            self.can_focus = False
-        else:
-            self.can_focus = True
-            self.add_class("--day")
+        self._day = 0
+        self._text = Text("  ")
+        # a disabled day can't be focused
+        self._disabled = False
+        self._set_day(int(label))
+        # position in the DayContainer
+        self.index = index
+        # records the renders, set by the DatePicker
+        self.metrics: Metrics | None = None
 
     @property
-    def day(self):
-        if int(self.label) > 0:
-            return int(self.label)
-        return None
+    def label(self) -> str:
+        return str(self._day)
 
-    def render(self) -> RenderableType:
-        if int(self.label) == 0:
-            output = "  "
-        else:
-            output = f"{self.label:>2}"
+    @label.setter
+    def label(self, label: int | str) -> None:
+        self.update(label)
 
-        return output
+    @property
+    def day(self) -> int | None:
+        return self._day or None
 
-    def update(self, label: str) -> None:
-        if int(label) == 0:
-            if self.has_focus:
-                self.post_message(self.FocusLost(self, int(self.label)))
-            self.can_focus = False
-            self.remove_class("--day")
-        else:
-            self.can_focus = True
-            self.add_class("--day")
-        self.label = label
-        self.refresh(layout=True)
+    @timed("day_render")
+    def render(self) -> RenderableType:
+        return self._text
+
+    def update(self, label: int | str) -> None:
+        day = int(label)
+        if day == 0 and self.has_focus:
+            self.post_message(self.FocusLost(self, self._day))
+        self._set_day(day)
+        # the size of a day never changes, no layout required
+        self.refresh()
+
+    def _set_day(self, day: int) -> None:
+        """Set the day with its text, focusability and class."""
+        self._day = day
+        self._text = Text(f"{day:>2}" if day else "  ")
+        self.can_focus = day != 0 and not self._disabled
+        self.set_class(day != 0, "--day")
+
+    def set_disabled(self, disabled: bool) -> None:
+        """Show the day as disabled, it can't be focused then."""
+        self._disabled = disabled
+        self.can_focus = self._day != 0 and not disabled
+        self.set_class(disabled, "--disabled")
 
     def on_focus(self, _event: events.Focus) -> None:
         self.post_message(self.Focused(self))
 
+    def on_enter(self, _event: events.Enter) -> None:
+        if self._day != 0:
+            self.post_message(self.Hovered(self))
+
     def on_key(self, event: events.Key) -> None:
         if event.key == "enter":
-            self.post_message(self.Selected(self, int(self.label)))
+            self.post_message(self.Selected(self, self._day))
 
     def on_click(self, event: events.MouseEvent) -> None:
-        if int(self.label) == 0:
+        if self._day == 0:
             return
 
-        self.post_message(self.Selected(self, int(self.label)))
+        self.post_message(self.Selected(self, self._day))
 
     class Focused(Message):
         def __init__(self, sender):
             super().__init__()
             self.sender = sender
 
+    class Hovered(Message):
+        """The mouse moved onto a day."""
+
+        def __init__(self, sender: DayLabel) -> None:
+            super().__init__()
+            self.sender = sender
+
     class FocusLost(Message):
         """A focusable day have become an unfocusable one."""
 
@@ -154,6 +212,311 @@ class DayLabel(Widget):
             super().__init__()
 
 
+class DayGrid(Widget, can_focus=True):
+    """All days of a month rendered by one widget, as an alternative to the
+    DayContainer with 42 DayLabels. The focused day is a cursor index."""
+
+    COMPONENT_CLASSES = {
+        "day-grid--today",
+        "day-grid--cursor",
+        "day-grid--hover",
+        "day-grid--range",
+        "day-grid--disabled",
+        "day-grid--marked",
+    }
+
+    DEFAULT_CSS = """
+    DayGrid {
+        width: 26;
+        height: 11;
+    }
+    DayGrid > .day-grid--today {
+        color: $secondary-lighten-1;
+        text-style: bold;
+    }
+    DayGrid > .day-grid--cursor {
+        text-style: bold reverse;
+    }
+    DayGrid > .day-grid--hover {
+        background: $surface-lighten-2;
+    }
+    DayGrid > .day-grid--range {
+        background: $accent-darken-2;
+    }
+    DayGrid > .day-grid--disabled {
+        color: $text-disabled;
+    }
+    DayGrid > .day-grid--marked {
+        text-style: underline;
+    }
+    """
+
+    # cell layout, same as the grid of the DayContainer
+    CELL_WIDTH = 2
+    COLUMN_GUTTER = 2
+    ROW_GUTTER = 1
+
+    # number of rendered lines kept for reuse, about 10 months
+    STRIP_CACHE_SIZE = 64
+
+    def __init__(
+        self,
+        days: [int],
+        today_index: int | None = None,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ):
+        super().__init__(name=name, id=id, classes=classes)
+        # 42 days (6 rows with 7 days), 0 for empty days
+        self.days = tuple(days)
+        self.today_index = today_index
+        # index of the focused day
+        self.cursor: int | None = None
+        # index of the day below the mouse
+        self.hover: int | None = None
+        # indexes of the highlighted days of a date range
+        self.range = range(0)
+        # bitmask of the days which can't be selected, bit 0 is index 0
+        self.disabled_days = 0
+        # marker names of the marked days by index
+        self.markers: dict[int, frozenset[str]] = {}
+        # records the renders, set by the DatePicker
+        self.metrics: Metrics | None = None
+        # rendered lines by what they show, least recently used first
+        self._strips: OrderedDict[tuple, Strip] = OrderedDict()
+
+    @property
+    def day(self) -> int | None:
+        """The day at the cursor."""
+        if self.cursor is None or self.days[self.cursor] == 0:
+            return None
+        return self.days[self.cursor]
+
+    def update(self, days: [int], today_index: int | None) -> None:
+        """Show other days, e.g. of another month. Only repaints the lines
+        with changed days."""
+        old_days, old_today_index, old_cursor = self.days, self.today_index, self.cursor
+        old_day = self.day
+        self.days = tuple(days)
+        self.today_index = today_index
+        if old_day is not None and self.days[self.cursor] == 0:
+            self.cursor = fallback_index(old_day)
+
+        changed = [
+            index for index, (old, new) in enumerate(zip(old_days, self.days))
+            if old != new
+        ]
+        if today_index != old_today_index:
+            changed += [old_today_index, today_index]
+        if self.cursor != old_cursor:
+            changed += [old_cursor, self.cursor]
+        self.refresh_days(*changed)
+
+    def refresh_days(self, *indexes: int | None) -> None:
+        """Repaint the lines with the days at the given indexes."""
+        width = self.size.width
+        cell_y = 1 + self.ROW_GUTTER
+        for row in {index // 7 for index in indexes if index is not None}:
+            self.refresh(Region(0, row * cell_y, width, 1))
+
+    def set_range(self, indexes: range) -> None:
+        """Highlight the days at indexes as a range. Only repaints the lines
+        with days entering or leaving the range."""
+        old_range = self.range
+        self.range = indexes
+        self.refresh_days(*set(old_range).symmetric_difference(indexes))
+
+    def set_disabled_days(self, disabled_days: int) -> None:
+        """Show the days of the bitmask as disabled. Only repaints the lines
+        with changed days."""
+        changed = self.disabled_days ^ disabled_days
+        self.disabled_days = disabled_days
+        self.refresh_days(*(index for index in range(42) if changed >> index & 1))
+
+    def set_markers(self, markers: dict[int, frozenset[str]]) -> None:
+        """Show the marked days. Only repaints the lines with changed days."""
+        old_markers = self.markers
+        self.markers = markers
+        self.refresh_days(*(
+            index for index in old_markers.keys() | markers.keys()
+            if old_markers.get(index) != markers.get(index)
+        ))
+
+    def move_cursor(self, index: int) -> None:
+        """Move the cursor to the day at index and focus the grid."""
+        old_cursor = self.cursor
+        self.cursor = index
+        self.focus()
+        self.refresh_days(old_cursor, index)
+
+    def index_at(self, x: int, y: int) -> int | None:
+        """The index of the day at the given offset, None if not on a day."""
+        cell_x = self.CELL_WIDTH + self.COLUMN_GUTTER
+        cell_y = 1 + self.ROW_GUTTER
+        if x < 0 or y < 0 or x % cell_x >= self.CELL_WIDTH or y % cell_y >= 1:
+            return None
+        column, row = x // cell_x, y // cell_y
+        if column >= 7 or row >= 6:
+            return None
+        index = row * 7 + column
+        if self.days[index] == 0:
+            return None
+        return index
+
+    @timed("day_render")
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        base_style = self.rich_style
+        cell_y = 1 + self.ROW_GUTTER
+        row = y // cell_y
+        if y % cell_y or row >= 6:
+            return Strip.blank(width, base_style)
+
+        # a line is rendered again only if something on it has changed, e.g.
+        # flipping back to a month or between months with the same layout
+        # reuses the lines; width and styles cover resizes and themes
+        styles = self._day_styles()
+        key = self._row_key(row) + (width, base_style, styles)
+        strip = self._strips.get(key)
+        if strip is not None:
+            self._strips.move_to_end(key)
+            return strip
+
+        strip = self._render_row(row, width, base_style, styles)
+        if len(self._strips) >= self.STRIP_CACHE_SIZE:
+            self._strips.popitem(last=False)
+        self._strips[key] = strip
+        return strip
+
+    def _row_key(self, row: int) -> tuple:
+        """Everything shown on a row, as columns of the row."""
+        first = row * 7
+
+        def column(index: int | None) -> int | None:
+            if index is None or not first <= index < first + 7:
+                return None
+            return index - first
+
+        range_start = min(max(self.range.start, first), first + 7) - first
+        range_stop = min(max(self.range.stop, first), first + 7) - first
+        return (
+            self.days[first:first + 7],
+            column(self.today_index),
+            column(self.cursor) if self.has_focus else None,
+            column(self.hover),
+            (range_start, range_stop) if range_start < range_stop else None,
+            self.disabled_days >> first & 0x7F,
+            tuple(index - first for index in range(first, first + 7)
+                  if index in self.markers),
+        )
+
+    def _day_styles(self) -> tuple[Style, ...]:
+        """The styles of today, cursor, hover, range, disabled and marked."""
+        return (
+            self.get_component_rich_style("day-grid--today"),
+            self.get_component_rich_style("day-grid--cursor"),
+            self.get_component_rich_style("day-grid--hover"),
+            self.get_component_rich_style("day-grid--range"),
+            self.get_component_rich_style("day-grid--disabled"),
+            self.get_component_rich_style("day-grid--marked"),
+        )
+
+    def _render_row(
+        self, row: int, width: int, base_style: Style, styles: tuple[Style, ...]
+    ) -> Strip:
+        (today_style, cursor_style, hover_style, range_style, disabled_style,
+         marked_style) = styles
+        gutter = Segment(" " * self.COLUMN_GUTTER, base_style)
+
+        segments = []
+        for index in range(row * 7, row * 7 + 7):
+            if index % 7:
+                segments.append(gutter)
+            day = self.days[index]
+            if day == 0:
+                segments.append(Segment(" " * self.CELL_WIDTH, base_style))
+                continue
+            style = base_style
+            if index == self.today_index:
+                style += today_style
+            if index in self.markers:
+                style += marked_style
+            if self.disabled_days >> index & 1:
+                style += disabled_style
+            if index in self.range:
+                style += range_style
+            if index == self.hover:
+                style += hover_style
+            if index == self.cursor and self.has_focus:
+                style += cursor_style
+            segments.append(Segment(f"{day:>{self.CELL_WIDTH}}", style))
+
+        return Strip(segments).adjust_cell_length(width, base_style)
+
+    def notify_style_update(self) -> None:
+        # the CSS has changed (e.g. another theme), the component styles of
+        # the cached lines are outdated
+        super().notify_style_update()
+        self._strips.clear()
+
+    def on_focus(self, _event: events.Focus) -> None:
+        if self.cursor is None:
+            if self.today_index is not None:
+                self.cursor = self.today_index
+            else:
+                self.cursor = self.days.index(1)
+        self.refresh_days(self.cursor)
+
+    def on_blur(self, _event: events.Blur) -> None:
+        self.refresh_days(self.cursor)
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "enter" and self.day is not None:
+            self.post_message(self.Selected(self, self.day))
+
+    def on_click(self, event: events.MouseEvent) -> None:
+        index = self.index_at(event.x, event.y)
+        if index is None:
+            return
+
+        self.move_cursor(index)
+        self.post_message(self.Selected(self, self.days[index]))
+
+    def on_mouse_move(self, event: events.MouseMove) -> None:
+        index = self.index_at(event.x, event.y)
+        if index != self.hover:
+            self.refresh_days(self.hover, index)
+            self.hover = index
+            if index is not None:
+                self.post_message(self.Hovered(self, index))
+
+    def on_leave(self, _event: events.Leave) -> None:
+        if self.hover is not None:
+            self.refresh_days(self.hover)
+            self.hover = None
+
+    class Hovered(Message):
+        """The mouse moved onto the day at index."""
+
+        def __init__(self, sender: DayGrid, index: int) -> None:
+            self.sender = sender
+            self.index = index
+            super().__init__()
+
+    class Selected(Message):
+        """A day was selected."""
+
+        def __init__(self, sender: DayGrid, day: int) -> None:
+            self.sender = sender
+            self.day = day
+            super().__init__()
+
+
+def _this_month() -> datetime.date:
+    return get_date_adapter().from_local_date(get_clock().today().replace(day=1))
+
+
 class DatePicker(Widget):
     DEFAULT_CSS = """
     DatePicker {
@@ -197,6 +560,15 @@ class DatePicker(Widget):
     DatePicker DayLabel.--today:focus {
         text-style: bold reverse;
     }
+    DatePicker DayLabel.--marked {
+        text-style: underline;
+    }
+    DatePicker DayLabel.--disabled {
+        color: $text-disabled;
+    }
+    DatePicker DayLabel.--range {
+        background: $accent-darken-2;
+    }
     DatePicker DayLabel.--day:hover {
         background: $surface-lighten-2;
     }
@@ -206,77 +578,437 @@ class DatePicker(Widget):
     month_label = Static("", classes="month")
 
     # the displayed month (always the first of the month)
-    date = reactive(pendulum.today().start_of("month"))
+    date = reactive(_this_month)
 
-    # The index of the focused day as int (including empty leading days)
-    focused: int | None
+    # The index of the focused day as int (including empty leading days),
+    # updated by navigation and focus events
+    focused: int | None = None
 
     # The selected date (on enter, click)
-    selected_date: pendulum.DateTime | None
+    selected_date: datetime.date | None
 
     # Container with all the selectable days
     day_container = None
 
+    # Single widget with all the days, replaces day_container if used
+    day_grid: DayGrid | None = None
+
+    # Header with month and year
+    month_header: MonthHeader | None = None
+
+    # Header of the weekdays, above the days
+    weekday_container: WeekdayContainer | None = None
+
+    # The shown view: "month" (days), "year" (months) or "decade" (years)
+    zoom: str = "month"
+
+    # Year and decade view, mounted when it is first shown
+    zoom_view: ZoomView | None = None
+
+    # The year of the year view, the decade view shows the years around it
+    _zoom_year: int = 0
+
+    # The days and the index of today as shown by the DayLabels
+    _shown_days: tuple[int, ...] = ()
+    _shown_today_index: int | None = None
+
+    # The indexes of the days shown as part of the range
+    _shown_range: range = range(0)
+
+    # Bitmask of the indexes of the days shown as disabled
+    _shown_disabled: int = 0
+
+    # The marker names of the days shown as marked, by index
+    _shown_markers: dict[int, frozenset[str]] = {}
+
     # A target widget where to send the message for a selected date
     target: Widget | None = None
 
-    def __init__(self):
+    def __init__(
+        self,
+        day_grid: bool = False,
+        coalesce_months: bool = False,
+        coalesce_interval: float | None = None,
+        clock: Clock | None = None,
+        date_adapter: DateAdapter | None = None,
+        metrics: Metrics | None = None,
+        select_range: bool = False,
+        constraints: DateConstraints | None = None,
+        markers: MarkerProvider | None = None,
+        locale: str | None = None,
+        firstweekday: int | None = None,
+    ):
         super().__init__()
+        # weekday headers and month names of the locale, the weekday headers
+        # start with firstweekday (0 is monday)
+        self.names = calendar_names(locale, firstweekday)
+        # markers of days (e.g. events), queried once per displayed month
+        self._markers = markers
+        # background loads of async markers and constraints per (year, month)
+        self._load_tasks: dict[tuple[int, int], asyncio.Task] = {}
+        # records timings of compose, updates, navigation and renders
+        self.metrics = metrics
+        # provides today, the shared clock if not given
+        self.clock = clock if clock is not None else get_clock()
+        # type of the dates set by the picker (e.g. pendulum)
+        self.date_adapter = (
+            date_adapter if date_adapter is not None else get_date_adapter()
+        )
+        # displayed month, cursor, selection and constraints, which the
+        # widgets render
+        self.model = CalendarModel(
+            self.clock.today(),
+            constraints=constraints,
+            select_range=select_range,
+            firstweekday=self.names.firstweekday,
+        )
+        if clock is not None or date_adapter is not None:
+            self.date = self.date_adapter.from_local_date(
+                self.clock.today().replace(day=1))
+        # render the days with one DayGrid instead of 42 DayLabels
+        self.use_day_grid = day_grid
+        # collect month changes (e.g. a held PageDown) and apply them at once,
+        # after the next refresh or after coalesce_interval seconds
+        self.coalesce_months = coalesce_months
+        self.coalesce_interval = coalesce_interval
+        # months to move which are not yet applied
+        self._pending_months = 0
+        self._pending_scheduled = False
+
+    @property
+    def constraints(self) -> DateConstraints | None:
+        """The dates which can be selected, all if None."""
+        return self.model.constraints
+
+    @constraints.setter
+    def constraints(self, constraints: DateConstraints | None) -> None:
+        self.model.constraints = constraints
+        self._update_disabled_days()
+        self._load_decorations()
+
+    @property
+    def markers(self) -> MarkerProvider | None:
+        """The provider of the day markers."""
+        return self._markers
+
+    @markers.setter
+    def markers(self, markers: MarkerProvider | None) -> None:
+        self._markers = markers
+        self._update_markers()
+        self._load_decorations()
+
+    def is_enabled(self, date: datetime.date) -> bool:
+        """True if the date can be selected."""
+        return self.model.is_enabled(date)
+
+    def set_metrics(self, metrics: Metrics | None) -> None:
+        """Record into other metrics, also the renders of the days."""
+        self.metrics = metrics
+        widgets = []
+        if self.day_container is not None:
+            widgets.extend(self.day_container.children)
+        if self.day_grid is not None:
+            widgets.append(self.day_grid)
+        if self.zoom_view is not None:
+            widgets.append(self.zoom_view.zoom_grid)
+        for widget in widgets:
+            widget.metrics = metrics
+
+    @property
+    def range_start(self) -> datetime.date | None:
+        """The first date of the selected range."""
+        if self.model.range_start is None:
+            return None
+        if not self.model.range_complete:
+            return self.date_adapter.from_date(self.model.range_start)
+        return self.date_adapter.from_date(self.model.range_bounds()[0])
+
+    @property
+    def range_end(self) -> datetime.date | None:
+        """The last date of the selected range, None while it is not selected."""
+        if not self.model.range_complete:
+            return None
+        return self.date_adapter.from_date(self.model.range_bounds()[1])
 
     @property
     def focused_day(self) -> DayLabel | None:
-        try:
-            return self.query_one("DayLabel:focus")
-        except NoMatches:
+        focused = self._focused_index()
+        if focused is None or self.day_container is None:
+            return None
+        return self.day_container.children[focused]
+
+    @property
+    def focused_date(self) -> datetime.date | None:
+        """The date of the focused day."""
+        focused = self._focused_index()
+        if focused is None or not self.layout.is_day(focused):
             return None
+        return self.date_adapter.from_date(self.model.date_at(focused))
 
+    @timed("compose")
     def compose(self) -> ComposeResult:
-        self.day_container = DayContainer(*self._build_day_widgets())
+        self.month_header = MonthHeader(date=self.date, names=self.names)
+        if self.use_day_grid:
+            self.day_grid = self._build_day_grid()
+            days = self.day_grid
+        else:
+            self.day_container = DayContainer(*self._build_day_widgets())
+            days = self.day_container
+        self.weekday_container = WeekdayContainer(*self._build_weekday_widgets())
         yield Vertical(
             Horizontal(
                 MonthControl("<", classes="left"),
-                MonthHeader(date=self.date),
+                self.month_header,
                 MonthControl(">", classes="right"),
                 classes="header"
             ),
-            WeekdayContainer(*self._build_weekday_widgets()),
-            self.day_container
+            self.weekday_container,
+            days
         )
 
-    def watch_date(self, _old_date, _new_date) -> None:
-        self._update_month_label()
+    def on_mount(self) -> None:
+        self._schedule_new_day()
+        self._load_decorations()
+
+    def on_unmount(self) -> None:
+        for task in self._load_tasks.values():
+            task.cancel()
+        self._load_tasks.clear()
+
+    def _schedule_new_day(self) -> None:
+        """Move the today marker at midnight."""
+        delay = self.clock.seconds_until_tomorrow()
+        if delay is not None:
+            self.set_timer(delay, self._on_new_day)
+
+    def _on_new_day(self) -> None:
         self._update_day_widgets()
+        self._schedule_new_day()
+
+    @timed("watch_date")
+    def watch_date(self, old_date, new_date) -> None:
+        if self.month_header is None:
+            # not yet composed, compose uses the new date
+            self.model.show_month(new_date)
+            return
+        focused = self._focused_index()
+        if focused is not None and self.model.month != add_months(new_date, 0):
+            # move the focused day of the shown month with the model, unless
+            # the model went to the new month itself (see _navigate)
+            self.model.month = add_months(old_date, 0)
+            self.model.cursor = focused
+        self.model.show_month(new_date)
+        # one repaint for header, days, today marker and focus
+        with self.app.batch_update():
+            self._update_month_label()
+            self._update_day_widgets()
+            if focused is not None and self._focused_index() != self.model.cursor:
+                # the day at the focus is disabled in this month
+                self._focus_index(self.model.cursor)
+        self._load_decorations()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
+        if self.zoom != "month":
+            if event.button.has_class("left"):
+                self._move_zoom(-1)
+            if event.button.has_class("right"):
+                self._move_zoom(1)
+            return
         if event.button.has_class("left"):
             self._prev_month()
         if event.button.has_class("right"):
             self._next_month()
 
+    async def on_month_header_selected(self, _event: MonthHeader.Selected) -> None:
+        if self.zoom == "month":
+            await self.show_zoom("year")
+        elif self.zoom == "year":
+            await self.show_zoom("decade")
+
+    def on_zoom_grid_selected(self, event: ZoomGrid.Selected) -> None:
+        if self.zoom == "decade":
+            self._zoom_year = self._first_zoom_year() + event.index
+            self.zoom = "year"
+            self._update_zoom()
+        else:
+            self.go_to(datetime.date(self._zoom_year, event.index + 1, 1))
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        event.stop()
+        date = parse_go_to(event.value)
+        if date is None:
+            self.app.bell()
+            return
+        event.input.value = ""
+        self.go_to(date)
+
+    def go_to(self, date: datetime.date) -> None:
+        """Show the month of date and focus its day (or the nearest selectable
+        day), with a single update of the days, however far away the month
+        is."""
+        self._pending_months = 0
+        if self.zoom != "month":
+            self._show_month_view()
+        self.date = self.date_adapter.from_date(add_months(date, 0))
+        self._focus_index(self._enabled_index(self.layout.index_of(date.day)))
+
+    def go_to_today(self) -> None:
+        """Show the month of today and focus today (or the nearest selectable
+        day)."""
+        # drop collected month changes, today wins
+        self._pending_months = 0
+        if self.zoom != "month":
+            self._show_month_view()
+        today = self.clock.today()
+        self.date = self.date_adapter.from_local_date(today)
+        self.model.home(today)
+        self._focus_index(self.model.cursor)
+
+    def clear_selection(self) -> None:
+        """Forget the selected date and range (e.g. for another target)."""
+        self.model.clear_selection()
+        self.selected_date = None
+        self._update_range()
+
+    def focus_default_day(self) -> None:
+        """Focus today if it is in the displayed month, the 1st otherwise
+        (or the nearest selectable day)."""
+        if self.zoom != "month":
+            self._show_month_view()
+        self._focus_index(self._focus_after_zoom())
+
+    async def show_zoom(self, zoom: str) -> None:
+        """Show the "year" view with the months of a year or the "decade" view
+        with the years around a decade, instead of the days."""
+        if self.zoom_view is None:
+            zoom_grid = ZoomGrid([])
+            zoom_grid.metrics = self.metrics
+            self.zoom_view = ZoomView(zoom_grid)
+            await self.weekday_container.parent.mount(self.zoom_view)
+        if self.zoom == "month":
+            self._zoom_year = self.date.year
+        self.zoom = zoom
+        with self.app.batch_update():
+            self.weekday_container.display = False
+            (self.day_grid or self.day_container).display = False
+            self.zoom_view.display = True
+            self._update_zoom()
+        self.zoom_view.zoom_grid.focus()
+
+    def _show_month_view(self) -> None:
+        self.zoom = "month"
+        self.zoom_view.display = False
+        self.weekday_container.display = True
+        (self.day_grid or self.day_container).display = True
+        self._update_month_label()
+
+    def _first_zoom_year(self) -> int:
+        """The first year of the decade view (the year before the decade)."""
+        return self._zoom_year // 10 * 10 - 1
+
+    def _move_zoom(self, count: int) -> None:
+        """Show the next (count > 0) or previous years or decades."""
+        self._zoom_year += count * (10 if self.zoom == "decade" else 1)
+        self._update_zoom()
+
+    def _update_zoom(self) -> None:
+        if self.zoom == "year":
+            items = self.names.month_abbrs[1:]
+            current = self.date.month - 1 if self.date.year == self._zoom_year else None
+            header = str(self._zoom_year)
+        else:
+            first_year = self._first_zoom_year()
+            items = [str(first_year + index) for index in range(12)]
+            current = self._zoom_year - first_year
+            header = f"{first_year + 1}-{first_year + 10}"
+        self.zoom_view.zoom_grid.set_items(items, current)
+        self.month_header.update_text(header)
+
     def on_day_label_focused(self, event: DayLabel.Focused) -> None:
-        self.focused = self.day_container.children.index(event.sender)
+        self.focused = self.model.cursor = event.sender.index
+        self._preview_range(self.focused)
+
+    def on_day_label_hovered(self, event: DayLabel.Hovered) -> None:
+        self._preview_range(event.sender.index)
+
+    def on_day_grid_hovered(self, event: DayGrid.Hovered) -> None:
+        self._preview_range(event.index)
 
     def on_day_label_focus_lost(self, event: DayLabel.FocusLost) -> None:
-        """The previous focused day is no longer focusable on this position.
-        If it was at the end of a month, set it to end of the 4th row, there
-        is always a focusable day. Otherwise to the first on the 2nd row.
-        """
-        if event.day >= 28:
-            self.day_container.children[27].focus()
-        else:
-            self.day_container.children[7].focus()
+        """The previous focused day is no longer focusable on this position,
+        see fallback_index."""
+        self._focus_index(fallback_index(event.day))
 
     def on_day_label_selected(self, event: DayLabel.Selected) -> None:
-        self.selected_date = pendulum.datetime(
-            self.date.year, self.date.month, event.day
-        )
+        self._select_day(event.day)
+
+    def on_day_grid_selected(self, event: DayGrid.Selected) -> None:
+        self._select_day(event.day)
+
+    def _select_day(self, day: int) -> None:
+        if not self.model.select(self.model.month.replace(day=day)):
+            return
+
+        self.selected_date = self.date_adapter.from_date(self.model.selection)
 
         self.post_message(self.Selected(self, self.selected_date))
 
         if self.target is not None:
             self.target.post_message(self.Selected(self, self.selected_date))
 
+        if not self.model.select_range:
+            return
+
+        self._update_range()
+        if not self.model.range_complete:
+            return
+
+        message = self.RangeSelected(self, self.range_start, self.range_end)
+        self.post_message(message)
+
+        if self.target is not None:
+            self.target.post_message(
+                self.RangeSelected(self, self.range_start, self.range_end))
+
+    def _preview_range(self, index: int | None) -> None:
+        """Show the range up to the day at index, while the end is open."""
+        if index is None or not self.layout.is_day(index):
+            return
+        if self.model.preview(self.model.date_at(index)):
+            self._update_range()
+
+    def _update_range(self) -> None:
+        """Highlight the range. Only the days entering or leaving it are
+        re-styled, also after a month change."""
+        indexes = self.model.range_indexes()
+        if indexes == self._shown_range:
+            return
+
+        if self.day_grid is not None:
+            self.day_grid.set_range(indexes)
+        elif self.day_container is not None and self.day_container.children:
+            day_labels = self.day_container.children
+            for idx in set(self._shown_range).symmetric_difference(indexes):
+                day_labels[idx].set_class(idx in indexes, "--range")
+        else:
+            # not yet composed, do nothing
+            return
+        self._shown_range = indexes
+
     def on_key(self, event: events.Key) -> None:
+        if self.zoom != "month":
+            if event.key == "pageup":
+                event.prevent_default()
+                self._move_zoom(-1)
+            if event.key == "pagedown":
+                event.prevent_default()
+                self._move_zoom(1)
+            if event.key == "escape":
+                event.stop()
+                self._show_month_view()
+                self._focus_index(self._focus_after_zoom())
+            return
+
         if event.key == "pageup":
             event.prevent_default()
             self._prev_month()
@@ -306,150 +1038,323 @@ class DatePicker(Widget):
         self._move_month(1)
 
     def _move_month(self, month_count: int) -> None:
-        self.date = pendulum.datetime(
-            self.date.year, self.date.month, 1).add(months=month_count)
-
-    def _handle_left(self) -> None:
-        focused_day = self.focused_day
-        if focused_day is None:
+        if not self.coalesce_months:
+            self.date = self.date_adapter.from_date(
+                add_months(self.date, month_count))
             return
 
-        nudging = False
-
-        if focused_day.day == 1:
-            nudging = True
-        elif self.focused % 7 == 0:
-            nudging = True
+        self._pending_months += month_count
+        if self._pending_scheduled:
+            return
 
-        if nudging:
-            self._prev_month()
+        self._pending_scheduled = True
+        if self.coalesce_interval is None:
+            self.call_after_refresh(self._apply_pending_months)
         else:
-            self.day_container.children[self.focused - 1].focus()
+            self.set_timer(self.coalesce_interval, self._apply_pending_months)
+
+    def _apply_pending_months(self) -> None:
+        """Move by the sum of the collected month changes."""
+        month_count = self._pending_months
+        self._pending_months = 0
+        self._pending_scheduled = False
+        if month_count != 0:
+            self.date = self.date_adapter.from_date(
+                add_months(self.date, month_count))
+
+    def _focused_index(self) -> int | None:
+        """The index of the focused day, None if no day has the focus."""
+        if self.day_grid is not None:
+            return self.day_grid.cursor if self.day_grid.has_focus else None
+        # the focus itself may still be on its way to self.focused
+        focused = self.app.focused
+        if not isinstance(focused, DayLabel) or focused.parent is not self.day_container:
+            return None
+        return self.focused
 
-    def _handle_right(self) -> None:
-        focused_day = self.focused_day
-        if focused_day is None:
+    @property
+    def layout(self) -> MonthLayout:
+        """The layout of the displayed month."""
+        return self.model.layout
+
+    def _focus_index(self, index: int) -> None:
+        self.model.cursor = index
+        if self.day_grid is not None:
+            self.day_grid.move_cursor(index)
+            self._preview_range(index)
+        else:
+            self.focused = index
+            self.day_container.children[index].focus()
+
+    def _navigate(self, move: Callable[[], None]) -> None:
+        """Apply a move of the model to the focused day: move the focus or,
+        if the model went to another month, change the month."""
+        focused = self._focused_index()
+        if focused is None:
             return
 
-        nudging = False
-
-        if self.focused % 7 == 6:
-            nudging = True
-        elif focused_day.day >= 28:
-            # 28 could be last day of month, check for an empty day at next index.
-            # index can't be out of range because there is always an empty day
-            # at the right
-            if self.day_container.children[self.focused + 1].day is None:
-                nudging = True
+        model = self.model
+        # while month changes are collected, moves start in the month they
+        # lead to, from the cursor of the previous move if it is there
+        month = add_months(self.date, self._pending_months)
+        if self._pending_months == 0 or model.month != month:
+            model.month = add_months(self.date, 0)
+            model.cursor = focused
+            model.show_month(month)
+        move()
+        if model.month != month:
+            self._move_month(
+                (model.month.year - month.year) * 12 + model.month.month - month.month)
+            if not self.coalesce_months or self._pending_months != 0:
+                return
+            # the collected changes lead back to the displayed month
+        if self._pending_months == 0 and model.cursor != focused:
+            self._focus_index(model.cursor)
+
+    @timed("handle_left")
+    def _handle_left(self) -> None:
+        self._navigate(self.model.left)
 
-        if nudging:
-            self._next_month()
-        else:
-            self.day_container.children[self.focused + 1].focus()
+    @timed("handle_right")
+    def _handle_right(self) -> None:
+        self._navigate(self.model.right)
 
+    @timed("handle_down")
     def _handle_down(self) -> None:
-        focused_day = self.focused_day
-        if focused_day is None:
-            return
+        self._navigate(self.model.down)
 
-        nudging = False
+    @timed("handle_up")
+    def _handle_up(self) -> None:
+        self._navigate(self.model.up)
 
-        if focused_day.day >= 28 - 7:
-            # from 21, we always can go to 28. only check for days after.
-            try:
-                # if day at index +7 is None, it's nudging
-                # also if there is no index
-                if self.day_container.children[self.focused + 7].day is None:
-                    nudging = True
-            except IndexError:
-                nudging = True
+    @timed("handle_home")
+    def _handle_home(self) -> None:
+        self.go_to_today()
 
-        if nudging:
+    def _update_month_label(self) -> None:
+        if self.month_header is None:
+            # not yet composed, do nothing
             return
+        self.month_header.update(date=self.date)
 
-        self.day_container.children[self.focused + 7].focus()
+    def _build_weekday_widgets(self) -> [WeekdayLabel]:
+        return [WeekdayLabel(day) for day in self.names.weekdays]
 
-    def _handle_up(self) -> None:
-        focused_day = self.focused_day
-        if focused_day is None:
-            return
+    def _build_day_widgets(self) -> [DayLabel]:
+        self._shown_days = self.layout.days
+        self._shown_today_index = self._today_index()
 
-        nudging = False
+        self._shown_disabled = self.model.disabled_days()
+        self._shown_markers = self._index_markers()
 
-        if focused_day.day <= 7:
-            nudging = True
+        day_widgets = []
+        for idx, day in enumerate(self._shown_days):
+            classes = "--today" if idx == self._shown_today_index else ""
+            for name in self._shown_markers.get(idx, ()):
+                classes += f" --marked --marker-{name}"
+            day_label = DayLabel(day, index=idx, classes=classes)
+            if self._shown_disabled >> idx & 1:
+                day_label.set_disabled(True)
+            day_label.metrics = self.metrics
+            day_widgets.append(day_label)
 
-        if nudging:
-            return
+        return day_widgets
 
-        self.day_container.children[self.focused - 7].focus()
+    def _build_day_grid(self) -> DayGrid:
+        day_grid = DayGrid(self.layout.days, self._today_index())
+        day_grid.metrics = self.metrics
+        day_grid.disabled_days = self.model.disabled_days()
+        day_grid.markers = self._index_markers()
+        return day_grid
 
-    def _handle_home(self) -> None:
-        self.date = pendulum.today()
-        self.query_one("DayLabel.--today").focus()
+    @timed("update_day_widgets")
+    def _update_day_widgets(self) -> None:
+        layout = self.layout
 
-    def _update_month_label(self) -> None:
-        try:
-            month_label = self.query_one(MonthHeader)
-        except NoMatches:
-            # not yet composed, do nothing
+        if self.day_grid is not None:
+            self.day_grid.update(layout.days, self._today_index())
+            self._update_disabled_days()
+            self._update_markers()
+            self._update_range()
             return
-        month_label.update(date=self.date)
 
-    def _build_weekday_widgets(self) -> [WeekdayLabel]:
-        widgets = []
-        weekdays = calendar.weekheader(2).split(" ")
-        for day in weekdays:
-            widgets.append(WeekdayLabel(day))
-
-        return widgets
-
-    def _build_day_widgets(self) -> [DayLabel]:
-        day_widgets = []
-        today_day = self._today_in_month()
+        if self.day_container is None:
+            # not yet composed, do nothing
+            return
 
-        days = calendar.monthcalendar(year=self.date.year, month=self.date.month)
-        days = [day for week in days for day in week]
+        # only touch the labels with another day or today marker
+        today_index = self._today_index()
+        old_days, old_today_index = self._shown_days, self._shown_today_index
+        day_labels = self.day_container.children
+        if not day_labels:
+            # not yet mounted, do nothing
+            return
+        # the focused day becomes empty: move the focus like on FocusLost,
+        # but right here instead of after another message
+        focused = self._focused_index()
+        lost_focus = focused is not None and not layout.is_day(focused)
+
+        for idx, (old, new) in enumerate(zip(old_days, layout.days)):
+            if old != new and not (lost_focus and idx == focused):
+                day_labels[idx].update(new)
+            if (idx == today_index) != (idx == old_today_index):
+                day_labels[idx].set_class(idx == today_index, "--today")
+
+        if lost_focus:
+            self.focused = fallback_index(old_days[focused])
+            self.screen.set_focus(day_labels[self.focused])
+            day_labels[focused].update(0)
+
+        self._shown_days = layout.days
+        self._shown_today_index = today_index
+        self._update_disabled_days()
+        self._update_markers()
+        self._update_range()
+
+    def _update_disabled_days(self) -> None:
+        """Mark the disabled days, only touches the days which changed."""
+        disabled_days = self.model.disabled_days()
+        if self.day_grid is not None:
+            self.day_grid.set_disabled_days(disabled_days)
+            return
 
+        if self.day_container is None or not self.day_container.children:
+            # not yet composed, do nothing
+            return
+        changed = self._shown_disabled ^ disabled_days
+        day_labels = self.day_container.children
         for idx in range(42):
-            # 42: 6 rows with 7 days
-            if idx < len(days):
-                if today_day == days[idx]:
-                    classes = "--today"
-                else:
-                    classes = ""
-                day_widgets.append(DayLabel(days[idx], classes=classes))
-            else:
-                day_widgets.append(DayLabel(0))
+            if changed >> idx & 1:
+                day_labels[idx].set_disabled(bool(disabled_days >> idx & 1))
+        self._shown_disabled = disabled_days
+
+    def _index_markers(self) -> dict[int, frozenset[str]]:
+        """The marker names of the displayed month by index."""
+        if self._markers is None:
+            return {}
+        return self._to_index_markers(
+            self._markers.month_markers(self.date.year, self.date.month))
+
+    def _to_index_markers(self, month_markers: MonthMarkers) -> dict[int, frozenset[str]]:
+        layout = self.layout
+        return {
+            layout.index_of(day): names for day, names in month_markers.items()
+        }
+
+    def _update_markers(self) -> None:
+        """Apply the markers of the displayed month as classes, only to the
+        days which changed."""
+        self._show_markers(self._index_markers())
+
+    def _show_markers(self, markers: dict[int, frozenset[str]]) -> None:
+        if self.day_grid is not None:
+            self.day_grid.set_markers(markers)
+            return
 
-        return day_widgets
+        if self.day_container is None or not self.day_container.children:
+            # not yet composed, do nothing
+            return
+        old_markers = self._shown_markers
+        day_labels = self.day_container.children
+        for idx in old_markers.keys() | markers.keys():
+            old_names = old_markers.get(idx, frozenset())
+            names = markers.get(idx, frozenset())
+            if old_names == names:
+                continue
+            day_label = day_labels[idx]
+            day_label.remove_class(*(f"--marker-{name}" for name in old_names - names))
+            day_label.add_class(*(f"--marker-{name}" for name in names - old_names))
+            day_label.set_class(bool(names), "--marked")
+        self._shown_markers = markers
+
+    def _load_decorations(self) -> None:
+        """Load the markers and disabled days of async providers for the
+        displayed month and prefetch the months before and after it. The
+        days are shown right away and decorated once a load is done. Loads
+        of months which are no longer near the displayed one are cancelled.
+        """
+        providers = [
+            provider for provider in (self._markers, self.model.constraints)
+            if provider is not None
+        ]
+        if not providers and not self._load_tasks:
+            return
 
-    def _update_day_widgets(self) -> None:
-        today_day = self._today_in_month()
+        month = add_months(self.date, 0)
+        months = [month, add_months(month, -1), add_months(month, 1)]
+        keys = [(month.year, month.month) for month in months]
 
-        days = calendar.monthcalendar(year=self.date.year, month=self.date.month)
-        days = [day for week in days for day in week]
+        for key in list(self._load_tasks):
+            if key not in keys:
+                self._load_tasks.pop(key).cancel()
 
-        for idx, day_label in enumerate(self.query("DayContainer DayLabel")):
-            if idx < len(days):
-                day_label.set_class(today_day == days[idx], "--today")
-                day_label.update(days[idx])
-            else:
-                day_label.update(0)
+        if not self.is_attached:
+            # loaded on mount
+            return
 
-    def _today_in_month(self) -> int | None:
-        """Returns todays day, if today is in the current month (self.date).
-        None otherwise."""
+        for key in keys:
+            if key in self._load_tasks:
+                continue
+            pending = [provider for provider in providers if provider.needs_load(*key)]
+            if pending:
+                self._load_tasks[key] = asyncio.create_task(
+                    self._load_month(key, pending))
+
+    async def _load_month(self, key: tuple[int, int], providers: list) -> None:
+        """Load a month from all providers, each one is applied when it is
+        done (if the month is still displayed)."""
+        try:
+            await asyncio.gather(*(
+                self._load_from(provider, key) for provider in providers))
+        finally:
+            if self._load_tasks.get(key) is asyncio.current_task():
+                del self._load_tasks[key]
 
-        today = pendulum.today()
-        if today.year == self.date.year and today.month == self.date.month:
-            return today.day
+    async def _load_from(self, provider, key: tuple[int, int]) -> None:
+        try:
+            await provider.load_month(*key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self.log.error(f"DatePicker: loading {key} failed: {error!r}")
+            return
 
-        return None
+        if (self.date.year, self.date.month) == key:
+            with self.app.batch_update():
+                if provider is self.model.constraints:
+                    self._update_disabled_days()
+                if provider is self._markers:
+                    self._update_markers()
+
+    def _focus_after_zoom(self) -> int:
+        """The index to focus when leaving a zoom view: today or the 1st, or
+        the nearest selectable day if it is disabled."""
+        today_index = self._today_index()
+        index = today_index if today_index is not None else self.layout.first_index
+        return self._enabled_index(index)
+
+    def _enabled_index(self, index: int) -> int:
+        """The nearest selectable day of index, index if there is none."""
+        enabled = self.model.enabled_index(index)
+        return enabled if enabled is not None else index
+
+    def _today_index(self) -> int | None:
+        """The index of today, if today is in the current month."""
+        return self.model.today_index(self.clock.today())
 
     class Selected(Message):
         """A date was selected."""
 
-        def __init__(self, sender: DatePicker, date: pendulum.DateTime) -> None:
+        def __init__(self, sender: DatePicker, date: datetime.date) -> None:
             self.date = date
             super().__init__()
+
+    class RangeSelected(Message):
+        """A date range was selected, start is never after end."""
+
+        def __init__(
+            self, sender: DatePicker, start: datetime.date, end: datetime.date
+        ) -> None:
+            self.start = start
+            self.end = end
+            super().__init__()
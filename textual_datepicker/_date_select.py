@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-import pendulum
+import datetime
+from weakref import WeakKeyDictionary
 
 from textual.app import ComposeResult
-from textual.widget import Widget, events
+from textual.widget import Widget, AwaitMount, events
+from textual.timer import Timer
 from textual.containers import Vertical
 from textual.reactive import reactive
 from textual.css.query import NoMatches
 
 # from textual import log
 
-from . import DatePicker
+from ._constraints import DateConstraints
+from ._date_picker import DatePicker
+from ._dates import DateAdapter, get_date_adapter
+from ._format import DateParser
+from ._metrics import Metrics, timed
+
+# Dialogs shared by all DateSelects with `shared_dialog=True`, per mount widget.
+_shared_dialogs: WeakKeyDictionary[Widget, DatePickerDialog] = WeakKeyDictionary()
 
 
 class DatePickerDialog(Widget):
@@ -33,17 +42,95 @@ class DatePickerDialog(Widget):
     # A target where to send the message for a selected date
     target = None
 
+    # Seconds after which a closed dialog removes itself (None: keep it)
+    idle_timeout: float | None = None
+
+    # Timer which removes the closed dialog after idle_timeout
+    _idle_timer: Timer | None = None
+
+    # Type of the dates of the DatePicker, the default adapter if None
+    date_adapter: DateAdapter | None = None
+
+    # Records timings of the dialog and its DatePicker
+    metrics: Metrics | None = None
+
+    # The dates which can be selected, all if None
+    constraints: DateConstraints | None = None
+
     def compose(self) -> ComposeResult:
-        self.date_picker = DatePicker()
+        self.date_picker = DatePicker(
+            date_adapter=self.date_adapter, metrics=self.metrics,
+            constraints=self.constraints)
         self.date_picker.target = self.target
         yield Vertical(self.date_picker)
 
+    def retarget(self, target: Widget) -> None:
+        """Send the selected dates to another target (used by shared dialogs).
+        The selection of the previous target is forgotten."""
+        if self.date_picker is not None and target is not self.target:
+            self.date_picker.clear_selection()
+        self.target = target
+        if self.date_picker is not None:
+            self.date_picker.target = target
+
+    def set_date_adapter(self, date_adapter: DateAdapter | None) -> None:
+        """Use another type of dates (used by shared dialogs)."""
+        self.date_adapter = date_adapter
+        if self.date_picker is not None:
+            self.date_picker.date_adapter = (
+                date_adapter if date_adapter is not None else get_date_adapter()
+            )
+
+    def set_metrics(self, metrics: Metrics | None) -> None:
+        """Record into other metrics (used by shared dialogs)."""
+        self.metrics = metrics
+        if self.date_picker is not None:
+            self.date_picker.set_metrics(metrics)
+
+    def set_constraints(self, constraints: DateConstraints | None) -> None:
+        """Use other constraints (used by shared dialogs)."""
+        self.constraints = constraints
+        if self.date_picker is not None and self.date_picker.constraints is not constraints:
+            self.date_picker.constraints = constraints
+
+    @timed("dialog_show")
+    def show(self) -> None:
+        """Display the dialog and stop a pending idle removal."""
+        if self._idle_timer is not None:
+            self._idle_timer.stop()
+            self._idle_timer = None
+        self.display = True
+
+    @timed("dialog_hide")
+    def hide(self) -> None:
+        """Hide the dialog and remove it after idle_timeout, if given."""
+        self.display = False
+        if self.idle_timeout is not None and self._idle_timer is None:
+            self._idle_timer = self.set_timer(self.idle_timeout, self._release)
+
+    def _release(self) -> None:
+        self._idle_timer = None
+        self.remove()
+
+    @property
+    def focus_within(self) -> bool:
+        """True if the focused widget is in the dialog."""
+        node = self.app.focused
+        while node is not None:
+            if node is self:
+                return True
+            node = node.parent
+        return False
+
     def on_descendant_blur(self, event: events.DescendantBlur) -> None:
-        if len(self.query("*:focus-within")) == 0:
-            self.display = False
+        # the focus has already moved when the blur arrives, it is enough to
+        # look at the ancestors of the focused widget (no query of all
+        # descendants on every move between days)
+        if not self.focus_within:
+            self.hide()
 
     def on_date_picker_selected(self, event: DatePicker.Selected) -> None:
-        self.display = False
+        self.hide()
 
         if self.target is not None:
             self.target.focus()
@@ -64,20 +151,30 @@ class DateSelect(Widget, can_focus=True):
     DateSelect:focus {
       border: tall $accent;
     }
+    DateSelect.-invalid {
+      border: tall $error;
+    }
     """
 
     # The value displayed in the select (which is the date)
     # value = reactive("", layout=True, init=False)
 
     # Date of the month which shall be shown when opening the dialog
-    date: reactive[pendulum.DateTime | None] = reactive(None)
+    date: reactive[datetime.date | None] = reactive(None)
 
     def __init__(
         self,
         picker_mount: str,
-        date: pendulum.DateTime | None = None,
+        date: datetime.date | None = None,
         format: str = "YYYY-MM-DD",
         placeholder: str = "",
+        shared_dialog: bool = False,
+        lazy_dialog: bool = False,
+        dialog_idle_timeout: float | None = None,
+        date_adapter: DateAdapter | None = None,
+        metrics: Metrics | None = None,
+        constraints: DateConstraints | None = None,
+        editable: bool = False,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -86,15 +183,40 @@ class DateSelect(Widget, can_focus=True):
         self.picker_mount = picker_mount
         self.placeholder = placeholder
         self.format = format
+        # share one dialog with all other DateSelects on the same picker_mount
+        self.shared_dialog = shared_dialog
+        # build the dialog on first open instead of on mount
+        self.lazy_dialog = lazy_dialog
+        # remove the dialog after it was closed for this many seconds
+        self.dialog_idle_timeout = dialog_idle_timeout
+        # formats the date, pendulum if installed
+        self.date_adapter = (
+            date_adapter if date_adapter is not None else get_date_adapter()
+        )
+        # records timings of the dialog and its DatePicker
+        self.metrics = metrics
+        # the dates which can be selected in the dialog, all if None
+        self.constraints = constraints
+        # a date can be typed, parsed with format
+        self.editable = editable
+        # the typed text, None if not typing
+        self._typed: str | None = None
+        # parses the typed text, created on the first keystroke
+        self._parser: DateParser | None = None
+        # the month shown in the dialog while typing
+        self._typed_month: tuple[int, int] | None = None
 
         if date is not None:
             self.date = date
 
         # DatePickerDialog widget
         self.dialog = None
+        # the widget of picker_mount, queried once while it stays mounted
+        self._mount_widget: Widget | None = None
+        self._mount_selector: str | None = None
 
     @property
-    def value(self) -> pendulum.DateTime:
+    def value(self) -> datetime.date | None:
         """Value of the current date."""
         return self.date
 
@@ -106,10 +228,12 @@ class DateSelect(Widget, can_focus=True):
         if text_space < 0:
             text_space = 0
 
-        if not self.date:
+        if self._typed is not None:
+            text = self._typed
+        elif not self.date:
             text = self.placeholder
         else:
-            text = self.date.format(self.format)
+            text = self.date_adapter.format(self.date, self.format)
 
         if len(text) > text_space:
             text = text[0:text_space]
@@ -119,27 +243,117 @@ class DateSelect(Widget, can_focus=True):
         return text
 
     def on_mount(self) -> None:
-        if self.dialog is None:
-            self.dialog = DatePickerDialog()
-            self.dialog.target = self
-            self.app.query_one(self.picker_mount).mount(self.dialog)
+        if self.dialog is None and not self.lazy_dialog:
+            self._mount_dialog()
 
-    def on_key(self, event: events.Key) -> None:
+    async def on_key(self, event: events.Key) -> None:
+        if self.editable and await self._edit(event):
+            return
         if event.key == "enter":
-            self._show_date_picker()
+            await self._show_date_picker()
 
-    def on_click(self, event: events.MouseEvent) -> None:
-        self._show_date_picker()
+    async def on_click(self, event: events.MouseEvent) -> None:
+        await self._show_date_picker()
 
     def on_blur(self) -> None:
-        pass
+        if self._typed is not None:
+            self._end_typing(commit=True)
+
+    async def _edit(self, event: events.Key) -> bool:
+        """Handle a key of the typed date, True if it was used."""
+        if event.is_printable:
+            event.stop()
+            await self._type((self._typed or "") + event.character)
+            return True
+        if self._typed is None:
+            return False
+        if event.key == "backspace":
+            event.stop()
+            await self._type(self._typed[:-1])
+            return True
+        if event.key in ("enter", "escape"):
+            event.stop()
+            if event.key == "enter" and self.has_class("-invalid"):
+                # keep the text to correct it, escape discards it
+                return True
+            self._end_typing(commit=event.key == "enter")
+            return True
+        return False
+
+    async def _type(self, text: str) -> None:
+        """Show the typed text. If it has another month, show the month in
+        the dialog, without moving the focus."""
+        self._typed = text
+        if self._parser is None or self._parser.format != self.format:
+            self._parser = DateParser(self.format)
+        parsed = self._parser.parse(text)
+        # no match, or a whole text which is not a date (e.g. 2022-02-31)
+        invalid = parsed is None or (parsed.complete and parsed.date is None)
+        self.set_class(invalid, "-invalid")
+        self.refresh()
+
+        if parsed is None or parsed.year is None or parsed.month is None:
+            return
+        if (parsed.year, parsed.month) == self._typed_month:
+            return
+        self._typed_month = (parsed.year, parsed.month)
+        await self._show_dialog()
+        self.dialog.date_picker.date = self.date_adapter.from_date(
+            datetime.date(parsed.year, parsed.month, 1))
+
+    def _end_typing(self, commit: bool) -> None:
+        """Stop typing, and take the typed date if commit and it is valid."""
+        parsed = self._parser.parse(self._typed)
+        if commit and parsed is not None and parsed.date is not None:
+            self.date = self.date_adapter.from_date(parsed.date)
+        self._typed = None
+        self.remove_class("-invalid")
+        if self._typed_month is not None:
+            self._typed_month = None
+            if self.dialog is not None and not self.dialog.focus_within:
+                self.dialog.hide()
+        self.refresh()
 
     def on_date_picker_selected(self, event: DatePicker.Selected) -> None:
         self.date = event.date
 
-    def _show_date_picker(self) -> None:
-        mnt_widget = self.app.query_one(self.picker_mount)
-        self.dialog.display = True
+    def _mount_dialog(self) -> AwaitMount | None:
+        """Mount a new dialog, or reuse the shared one of the mount widget.
+        Returns the awaitable of the mount, None if nothing was mounted."""
+        mnt_widget = self._picker_mount_widget()
+        if self.shared_dialog:
+            dialog = _shared_dialogs.get(mnt_widget)
+            if dialog is not None and dialog.is_attached:
+                self.dialog = dialog
+                return None
+
+        self.dialog = DatePickerDialog()
+        self.dialog.target = self
+        self.dialog.idle_timeout = self.dialog_idle_timeout
+        self.dialog.date_adapter = self.date_adapter
+        self.dialog.metrics = self.metrics
+        self.dialog.constraints = self.constraints
+
+        if self.shared_dialog:
+            _shared_dialogs[mnt_widget] = self.dialog
+
+        return mnt_widget.mount(self.dialog)
+
+    async def _show_dialog(self) -> None:
+        """Mount the dialog if needed, and show it below the DateSelect."""
+        if self.dialog is None or not self.dialog.is_attached:
+            # lazy or removed after being idle
+            await_mount = self._mount_dialog()
+            if await_mount is not None:
+                await await_mount
+
+        mnt_widget = self._picker_mount_widget()
+        if self.shared_dialog:
+            self.dialog.retarget(self)
+            self.dialog.set_date_adapter(self.date_adapter)
+            self.dialog.set_metrics(self.metrics)
+            self.dialog.set_constraints(self.constraints)
+        self.dialog.show()
 
         # calculate offset of DateSelect and apply it to DatePickerDialog
         self.dialog.offset = self.region.offset - mnt_widget.content_region.offset
@@ -149,18 +363,40 @@ class DateSelect(Widget, can_focus=True):
         self.dialog.offset = (
             self.dialog.offset.x, self.dialog.offset.y + 3)
 
+    def _picker_mount_widget(self) -> Widget:
+        """The widget of picker_mount. It is queried again only if it was
+        removed or picker_mount has changed."""
+        mnt_widget = self._mount_widget
+        if (
+            mnt_widget is None
+            or self._mount_selector != self.picker_mount
+            or not mnt_widget.is_attached
+        ):
+            try:
+                mnt_widget = self.app.query_one(self.picker_mount)
+            except NoMatches:
+                raise NoMatches(
+                    f"DateSelect: picker_mount {self.picker_mount!r} matches no "
+                    "widget. It has to select a mounted container where the "
+                    "dialog can appear, e.g. \"#main_container\"."
+                ) from None
+            self._mount_widget = mnt_widget
+            self._mount_selector = self.picker_mount
+        return mnt_widget
+
+    async def _show_date_picker(self) -> None:
+        # a shared dialog may still show the month of another DateSelect
+        other_target = (
+            self.shared_dialog and self.dialog is not None
+            and self.dialog.target is not self
+        )
+        await self._show_dialog()
+
+        date_picker = self.dialog.date_picker
         if self.date is not None:
-            if self.date is not None:
-                self.dialog.date_picker.date = self.date
-            for day in self.dialog.query("DayLabel.--day"):
-                if day.day == self.date.day:
-                    day.focus()
-                    break
+            # the day is found by its index in the month layout
+            date_picker.go_to(self.date)
+        elif other_target:
+            date_picker.go_to_today()
         else:
-            try:
-                self.dialog.query_one("DayLabel.--today").focus()
-            except NoMatches:   # pragma: no cover
-                # should never happen, because DatePicker always opens this
-                # month without a given date. just to be sure,
-                # catching query_one fails.
-                self.dialog.query("DayLabel.--day").first().focus()
+            date_picker.focus_default_day()
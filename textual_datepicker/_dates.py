@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from ._format import format_date
+
+
+class DateAdapter:
+    """Converts between datetime.date, used by the widgets internally, and the
+    dates of the public API. This one uses datetime.date itself."""
+
+    def from_date(self, date: datetime.date) -> Any:
+        """The API date for a datetime.date."""
+        return date
+
+    def from_local_date(self, date: datetime.date) -> Any:
+        """The API date for a date of the local calendar, e.g. today or the
+        month of today."""
+        return self.from_date(date)
+
+    def format(self, date: Any, format: str) -> str:
+        """Format an API date with pendulum-like tokens."""
+        return format_date(date, format)
+
+
+class PendulumAdapter(DateAdapter):
+    """Uses pendulum.DateTime (at midnight, UTC) as date of the public API."""
+
+    def __init__(self) -> None:
+        import pendulum
+
+        self._pendulum = pendulum
+
+    def from_date(self, date: datetime.date) -> Any:
+        return self._pendulum.datetime(date.year, date.month, date.day)
+
+    def from_local_date(self, date: datetime.date) -> Any:
+        # midnight in the local timezone, like pendulum.today()
+        return self._pendulum.datetime(date.year, date.month, date.day, tz="local")
+
+    def format(self, date: Any, format: str) -> str:
+        if not isinstance(date, self._pendulum.Date):
+            date = self.from_date(date)
+        return date.format(format)
+
+
+_adapter: DateAdapter | None = None
+
+
+def get_date_adapter() -> DateAdapter:
+    """The adapter used by widgets without their own adapter: pendulum if it
+    is installed, datetime.date otherwise."""
+    global _adapter
+    if _adapter is None:
+        try:
+            _adapter = PendulumAdapter()
+        except ImportError:
+            _adapter = DateAdapter()
+    return _adapter
+
+
+def set_date_adapter(adapter: DateAdapter) -> None:
+    """Replace the adapter used by widgets without their own adapter."""
+    global _adapter
+    _adapter = adapter
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """The first of the month, the given number of months after date."""
+    month_index = date.year * 12 + date.month - 1 + months
+    return datetime.date(month_index // 12, month_index % 12 + 1, 1)
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import calendar
+import datetime
+import locale as _locale
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# Supported tokens, a subset of the pendulum tokens. Text in brackets is kept.
+_TOKENS = re.compile(r"\[[^\]]*\]|YYYY|YY|MMMM|MMM|MM|M|Do|DD|D|dddd|ddd|dd")
+
+
+def _ordinal(day: int) -> str:
+    if 11 <= day % 100 <= 13:
+        return f"{day}th"
+    return f"{day}{({1: 'st', 2: 'nd', 3: 'rd'}).get(day % 10, 'th')}"
+
+
+_FORMATTERS = {
+    "YYYY": lambda date, names: f"{date.year:04}",
+    "YY": lambda date, names: f"{date.year % 100:02}",
+    "MMMM": lambda date, names: names.month_names[date.month],
+    "MMM": lambda date, names: names.month_abbrs[date.month],
+    "MM": lambda date, names: f"{date.month:02}",
+    "M": lambda date, names: str(date.month),
+    "Do": lambda date, names: _ordinal(date.day),
+    "DD": lambda date, names: f"{date.day:02}",
+    "D": lambda date, names: str(date.day),
+    "dddd": lambda date, names: names.day_names[date.weekday()],
+    "ddd": lambda date, names: names.day_abbrs[date.weekday()],
+    "dd": lambda date, names: names.day_abbrs[date.weekday()][:2],
+}
+
+
+class CalendarNames:
+    """The weekday and month names of a locale, and the weekday headers in
+    the order of the columns for a first weekday.
+
+    Get them with calendar_names(), which creates them once per (locale,
+    firstweekday) for the whole process.
+    """
+
+    def __init__(
+        self,
+        locale: str | None,
+        firstweekday: int,
+        day_names: tuple[str, ...],
+        day_abbrs: tuple[str, ...],
+        month_names: tuple[str, ...],
+        month_abbrs: tuple[str, ...],
+    ) -> None:
+        self.locale = locale
+        # the weekday of the first column, 0 is monday
+        self.firstweekday = firstweekday
+        # weekday names, index 0 is monday
+        self.day_names = day_names
+        self.day_abbrs = day_abbrs
+        # month names, index 1 is january (index 0 is empty)
+        self.month_names = month_names
+        self.month_abbrs = month_abbrs
+        # 2 letter weekday headers, the first one is firstweekday
+        self.weekdays = tuple(
+            day_abbrs[(firstweekday + column) % 7][:2] for column in range(7))
+        # formatted month titles per (format, year, month)
+        self._titles: dict[tuple[str, int, int], str] = {}
+
+    def month_title(self, date: datetime.date, format: str) -> str:
+        """The month of date formatted with format (e.g. "MMMM\\nYYYY"),
+        formatted once per month."""
+        key = (format, date.year, date.month)
+        title = self._titles.get(key)
+        if title is None:
+            if len(self._titles) >= 1024:
+                self._titles.clear()
+            title = self._titles[key] = format_date(
+                datetime.date(date.year, date.month, 1), format, self)
+        return title
+
+
+def calendar_names(
+    locale: str | None = None, firstweekday: int | None = None
+) -> CalendarNames:
+    """The (cached) names of a locale, e.g. "de". Without locale, the names
+    of the calendar module are used, without firstweekday its first weekday.
+
+    The locales of pendulum are used if it is installed, the locales of the
+    system otherwise. Raises ValueError for unknown locales."""
+    if firstweekday is None:
+        firstweekday = calendar.firstweekday()
+    return _calendar_names(locale, firstweekday)
+
+
+@lru_cache(maxsize=32)
+def _calendar_names(locale: str | None, firstweekday: int) -> CalendarNames:
+    if locale is None:
+        names = _system_names()
+    else:
+        try:
+            names = _pendulum_names(locale)
+        except ImportError:
+            names = _system_locale_names(locale)
+    return CalendarNames(locale, firstweekday, *names)
+
+
+def _system_locale_names(locale: str) -> tuple[tuple[str, ...], ...]:
+    # the system needs full names like "de_DE.UTF-8", short codes like "de"
+    # or "fr-CA" are expanded with locale.normalize
+    normalized = _locale.normalize(locale.replace("-", "_"))
+    candidates = [locale, normalized.split(".")[0] + ".UTF-8", normalized]
+    for candidate in dict.fromkeys(candidates):
+        try:
+            with calendar.different_locale(candidate):
+                return _system_names()
+        except _locale.Error:
+            continue
+    raise ValueError(f"Locale [{locale}] does not exist.")
+
+
+def _system_names() -> tuple[tuple[str, ...], ...]:
+    return (
+        tuple(calendar.day_name),
+        tuple(calendar.day_abbr),
+        tuple(calendar.month_name),
+        tuple(calendar.month_abbr),
+    )
+
+
+def _pendulum_names(locale: str) -> tuple[tuple[str, ...], ...]:
+    from pendulum.locales.locale import Locale
+
+    translations = Locale.load(locale).get("translations")
+    # pendulum starts the week with sunday
+    days = translations["days"]
+    months = translations["months"]
+    return (
+        tuple(days["wide"][(weekday + 1) % 7] for weekday in range(7)),
+        tuple(days["short"][(weekday + 1) % 7] for weekday in range(7)),
+        ("",) + tuple(months["wide"][month] for month in range(1, 13)),
+        ("",) + tuple(months["abbreviated"][month] for month in range(1, 13)),
+    )
+
+
+@lru_cache(maxsize=64)
+def compile_format(format: str) -> tuple[str, ...]:
+    """Split a format into tokens and literal text."""
+    parts = []
+    position = 0
+    for match in _TOKENS.finditer(format):
+        if match.start() > position:
+            parts.append(format[position:match.start()])
+        token = match.group()
+        if token.startswith("["):
+            # escaped text, without brackets
+            parts.append(token[1:-1])
+        else:
+            parts.append(token)
+        position = match.end()
+    if position < len(format):
+        parts.append(format[position:])
+    return tuple(parts)
+
+
+def format_date(
+    date: datetime.date, format: str, names: CalendarNames | None = None
+) -> str:
+    """Format a date with pendulum-like tokens, e.g. "YYYY-MM-DD". The names
+    of months and weekdays are the ones of names, of the calendar module if
+    None."""
+    if names is None:
+        names = calendar_names()
+    return "".join(
+        _FORMATTERS[part](date, names) if part in _FORMATTERS else part
+        for part in compile_format(format)
+    )
+
+
+# numeric tokens: (min digits, max digits, max value)
+_NUMBERS = {
+    "YYYY": (4, 4, 9999),
+    "YY": (2, 2, 99),
+    "MM": (2, 2, 12),
+    "M": (1, 2, 12),
+    "DD": (2, 2, 31),
+    "D": (1, 2, 31),
+    "Do": (1, 2, 31),
+}
+
+# the names of the name tokens, the index is the value
+_NAMES = {
+    "MMMM": list(calendar.month_name),
+    "MMM": list(calendar.month_abbr),
+    "dddd": list(calendar.day_name),
+    "ddd": list(calendar.day_abbr),
+    "dd": [name[:2] for name in calendar.day_abbr],
+}
+
+# the field of the date which a token sets
+_FIELDS = {
+    "YYYY": "year", "YY": "year",
+    "MMMM": "month", "MMM": "month", "MM": "month", "M": "month",
+    "Do": "day", "DD": "day", "D": "day",
+}
+
+
+class ParsedDate(NamedTuple):
+    """A parsed, maybe partial, date text. Fields which are not (yet) typed
+    are None."""
+
+    year: int | None
+    month: int | None
+    day: int | None
+
+    # the text matches the whole format
+    complete: bool
+
+    @property
+    def date(self) -> datetime.date | None:
+        """The date of a complete text, None if incomplete or invalid."""
+        if not self.complete or None in (self.year, self.month, self.day):
+            return None
+        try:
+            return datetime.date(self.year, self.month, self.day)
+        except ValueError:
+            return None
+
+
+class DateParser:
+    """Parses typed text with a format, e.g. "YYYY-MM-DD", also partial text
+    like "2022-0".
+
+    The parser is incremental: it remembers the parsed parts of the last
+    text and, after a keystroke, only parses the parts behind the change.
+    """
+
+    def __init__(self, format: str) -> None:
+        self.format = format
+        self.parts = compile_format(format)
+        self._text = ""
+        # after each parsed part: its end in the text and the fields so far
+        self._checkpoints: list[tuple[int, dict[str, int]]] = []
+
+    def parse(self, text: str) -> ParsedDate | None:
+        """The parsed text, None if it does not match the format."""
+        common = 0
+        for old, new in zip(self._text, text):
+            if old != new:
+                break
+            common += 1
+        # a part ending at the change may depend on the changed character
+        while self._checkpoints and self._checkpoints[-1][0] >= common:
+            self._checkpoints.pop()
+        self._text = text
+
+        if self._checkpoints:
+            position, fields = self._checkpoints[-1]
+            fields = dict(fields)
+        else:
+            position, fields = 0, {}
+
+        for part in self.parts[len(self._checkpoints):]:
+            result = self._parse_part(part, text, position)
+            if result is None:
+                return None
+            position, value, finished = result
+            if value is not None and part in _FIELDS:
+                fields[_FIELDS[part]] = value
+            if not finished:
+                return self._result(fields, complete=False)
+            self._checkpoints.append((position, dict(fields)))
+
+        if position != len(text):
+            # more text than the format
+            return None
+        return self._result(fields, complete=True)
+
+    @staticmethod
+    def _result(fields: dict[str, int], complete: bool) -> ParsedDate:
+        return ParsedDate(
+            fields.get("year"), fields.get("month"), fields.get("day"), complete)
+
+    @staticmethod
+    def _parse_part(
+        part: str, text: str, position: int
+    ) -> tuple[int, int | None, bool] | None:
+        """Parse one part of the format at position. Returns the end, the
+        value (if any) and whether the part is finished, None if the text
+        does not match."""
+        rest = text[position:]
+
+        if part in _NUMBERS:
+            min_digits, max_digits, max_value = _NUMBERS[part]
+            digits = ""
+            for character in rest[:max_digits]:
+                if not character.isdigit():
+                    break
+                digits += character
+            end = position + len(digits)
+            at_end = end == len(text)
+            if len(digits) < min_digits:
+                return (end, None, False) if at_end else None
+            value = int(digits)
+            if value > max_value:
+                return None
+            if at_end and len(digits) < max_digits and value * 10 <= max_value:
+                # another digit may follow
+                return end, None, False
+            if part == "YY":
+                value += 2000
+            if part == "Do":
+                suffix = _ordinal(value)[len(digits):]
+                typed = text[end:end + len(suffix)]
+                if typed != suffix:
+                    if suffix.startswith(typed) and end + len(typed) == len(text):
+                        return len(text), value, False
+                    return None
+                end += len(suffix)
+            if value == 0:
+                # no day, month or year 0 (datetime starts with year 1)
+                return None
+            return end, value, True
+
+        if part in _NAMES:
+            lowered = rest.lower()
+            names = _NAMES[part]
+            matches = [
+                index for index, name in enumerate(names)
+                if name and lowered.startswith(name.lower())
+            ]
+            if matches:
+                index = max(matches, key=lambda index: len(names[index]))
+                value = index if part in _FIELDS else None
+                return position + len(names[index]), value, True
+            prefixes = [
+                index for index, name in enumerate(names)
+                if name and name.lower().startswith(lowered)
+            ]
+            if not prefixes:
+                return None
+            value = prefixes[0] if len(prefixes) == 1 and part in _FIELDS else None
+            return len(text), value, False
+
+        # literal text
+        if rest.startswith(part):
+            return position + len(part), None, True
+        if part.startswith(rest):
+            return len(text), None, False
+        return None
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import calendar
+import datetime
+import inspect
+from bisect import bisect_left, bisect_right
+from typing import Dict, FrozenSet, Iterable
+
+# markers per day of a month (1 is the 1st)
+MonthMarkers = Dict[int, FrozenSet[str]]
+
+
+class MarkerProvider:
+    """Provides markers (names like "event" or "birthday") for days.
+
+    The DatePicker asks once per displayed month with the date range of the
+    month, the results are cached per month. Subclasses implement markers(),
+    e.g. with one query to a database. If markers() is a coroutine function,
+    the months are loaded in the background with load_month() and have no
+    markers until they are loaded.
+    """
+
+    def __init__(self, cache_size: int = 24) -> None:
+        # number of cached months
+        self.cache_size = cache_size
+        self._cache: dict[tuple[int, int], MonthMarkers] = {}
+
+    def markers(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterable[tuple[datetime.date, str]]:
+        """The markers of the days from start to end (both included), as
+        pairs of date and marker name."""
+        raise NotImplementedError
+
+    @property
+    def is_async(self) -> bool:
+        """True if markers() is a coroutine function."""
+        return inspect.iscoroutinefunction(self.markers)
+
+    def month_markers(self, year: int, month: int) -> MonthMarkers:
+        """The (cached) markers of a month. For async providers only the
+        loaded months have markers."""
+        key = (year, month)
+        month_markers = self._cache.get(key)
+        if month_markers is None:
+            if self.is_async:
+                return {}
+            month_markers = self._group(self.markers(*self._month_range(year, month)))
+            self._cache_month(key, month_markers)
+        return month_markers
+
+    def needs_load(self, year: int, month: int) -> bool:
+        """True if the month has to be loaded with load_month()."""
+        return self.is_async and (year, month) not in self._cache
+
+    async def load_month(self, year: int, month: int) -> None:
+        """Load the markers of a month from an async provider."""
+        month_markers = self._group(await self.markers(*self._month_range(year, month)))
+        self._cache_month((year, month), month_markers)
+
+    def clear_cache(self) -> None:
+        """Forget the cached months, e.g. after the source has changed."""
+        self._cache.clear()
+
+    def _cache_month(self, key: tuple[int, int], month_markers: MonthMarkers) -> None:
+        if len(self._cache) >= self.cache_size:
+            # drop the oldest month
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = month_markers
+
+    @staticmethod
+    def _month_range(year: int, month: int) -> tuple[datetime.date, datetime.date]:
+        _, days_in_month = calendar.monthrange(year, month)
+        return datetime.date(year, month, 1), datetime.date(year, month, days_in_month)
+
+    @staticmethod
+    def _group(markers: Iterable[tuple[datetime.date, str]]) -> MonthMarkers:
+        names: dict[int, set[str]] = {}
+        for date, name in markers:
+            names.setdefault(date.day, set()).add(name)
+        return {day: frozenset(day_names) for day, day_names in names.items()}
+
+
+class MarkerIndex(MarkerProvider):
+    """Markers of an in-memory source, sorted by date. A month is looked up
+    with bisect instead of a scan over all entries."""
+
+    def __init__(
+        self,
+        markers: Iterable[tuple[datetime.date, str]] = (),
+        cache_size: int = 24,
+    ) -> None:
+        super().__init__(cache_size=cache_size)
+        entries = sorted(
+            (datetime.date(date.year, date.month, date.day), name)
+            for date, name in markers
+        )
+        self._dates = [date for date, _ in entries]
+        self._names = [name for _, name in entries]
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def markers(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterable[tuple[datetime.date, str]]:
+        low = bisect_left(self._dates, start)
+        high = bisect_right(self._dates, end)
+        return zip(self._dates[low:high], self._names[low:high])
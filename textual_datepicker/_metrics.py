@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import inspect
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+
+class Metrics:
+    """Counts and timings of DatePicker and DateSelect operations.
+
+    Pass it as `metrics` to the widgets. Every recorded operation is also
+    given to the callback, if any, and written to the textual log (devtools)
+    if `log` is True.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[str, float], None] | None = None,
+        log: bool = False,
+    ) -> None:
+        self.callback = callback
+        self.log = log
+        # operation -> number of calls
+        self.counts: dict[str, int] = {}
+        # operation -> sum of the durations in seconds
+        self.durations: dict[str, float] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        """Record one call of the operation name, which took duration seconds."""
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        if self.callback is not None:
+            self.callback(name, duration)
+        if self.log:
+            from textual import log
+
+            log(f"textual_datepicker {name}: {duration * 1000:.3f} ms")
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, total and average duration per operation."""
+        return {
+            name: {
+                "count": count,
+                "total": self.durations[name],
+                "average": self.durations[name] / count,
+            }
+            for name, count in self.counts.items()
+        }
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.durations.clear()
+
+
+def timed(name: str):
+    """Record the calls of a method in `self.metrics`, if it is set."""
+
+    def decorator(method):
+        if inspect.isgeneratorfunction(method):
+            # e.g. compose: time the creation of all yielded widgets
+            @wraps(method)
+            def generator_wrapper(self, *args, **kwargs):
+                metrics = self.metrics
+                if metrics is None:
+                    return method(self, *args, **kwargs)
+                start = perf_counter()
+                result = list(method(self, *args, **kwargs))
+                metrics.record(name, perf_counter() - start)
+                return result
+
+            return generator_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            start = perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                metrics.record(name, perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import datetime
+
+from ._calendar import MonthLayout, month_layout
+from ._constraints import DateConstraints
+from ._dates import add_months
+
+
+def fallback_index(day: int) -> int:
+    """Where the cursor goes when its day becomes empty in another month:
+    for a day at the end of a month the end of the 4th row (there is always
+    a day), otherwise the first day on the 2nd row."""
+    return 27 if day >= 28 else 7
+
+
+class CalendarModel:
+    """The state of a month calendar: the displayed month, the cursor, the
+    selection (a date or a range) and the constraints, with the navigation
+    rules of the DatePicker.
+
+    Pure Python without widgets. The DatePicker keeps one and only renders
+    it, so the rules can be tested (and reused) without an app.
+    """
+
+    def __init__(
+        self,
+        month: datetime.date,
+        constraints: DateConstraints | None = None,
+        select_range: bool = False,
+        firstweekday: int | None = None,
+    ) -> None:
+        # the displayed month (always the first of the month)
+        self.month = add_months(month, 0)
+        # index of the day with the cursor (the focused day), None if none
+        self.cursor: int | None = None
+        # the dates which can be selected, all if None
+        self.constraints = constraints
+        # first day of the week, the one of the calendar module if None
+        self.firstweekday = firstweekday
+        # select a start and an end date instead of a single date
+        self.select_range = select_range
+        # the last selected date
+        self.selection: datetime.date | None = None
+        # the range: start, end and the date at the cursor or the mouse as
+        # preview for the end while it is not selected
+        self.range_start: datetime.date | None = None
+        self.range_end: datetime.date | None = None
+        self.range_preview: datetime.date | None = None
+
+    @property
+    def layout(self) -> MonthLayout:
+        """The layout of the displayed month."""
+        return month_layout(self.month.year, self.month.month, self.firstweekday)
+
+    def day_at(self, index: int) -> int | None:
+        """The day at index, None for empty days. Raises IndexError."""
+        return self.layout.days[index] or None
+
+    def date_at(self, index: int) -> datetime.date | None:
+        """The date at index, None for empty days."""
+        day = self.day_at(index)
+        return self.month.replace(day=day) if day is not None else None
+
+    @property
+    def cursor_date(self) -> datetime.date | None:
+        """The date at the cursor."""
+        return self.date_at(self.cursor) if self.cursor is not None else None
+
+    def index_of(self, date: datetime.date) -> int | None:
+        """The index of the date, None if it is not in the displayed month."""
+        if (date.year, date.month) != (self.month.year, self.month.month):
+            return None
+        return self.layout.index_of(date.day)
+
+    def is_enabled(self, date: datetime.date) -> bool:
+        """True if the date can be selected."""
+        return self.constraints is None or self.constraints.is_enabled(date)
+
+    def disabled_days(self) -> int:
+        """Bitmask of the indexes of the disabled days of the displayed month."""
+        if self.constraints is None:
+            return 0
+        layout = self.layout
+        days_in_month = layout.last_index - layout.first_index + 1
+        enabled = self.constraints.month_mask(self.month.year, self.month.month)
+        return (~enabled & ((1 << days_in_month) - 1)) << layout.first_index
+
+    def next_enabled_index(self, index: int, step: int) -> int | None:
+        """The index of the next selectable day from index in steps of step
+        days, skipping disabled days. None if there is none in the month."""
+        if self.constraints is None:
+            return index + step
+        layout = self.layout
+        day = self.constraints.next_enabled(
+            self.month.year, self.month.month, layout.days[index], step)
+        if day is None:
+            return None
+        return layout.index_of(day)
+
+    def enabled_index(self, index: int) -> int | None:
+        """The index of the selectable day nearest to index: index itself,
+        else the next or the previous selectable day. None if no day of the
+        month can be selected."""
+        layout = self.layout
+        index = min(max(index, layout.first_index), layout.last_index)
+        if self.constraints is None or self.is_enabled(self.date_at(index)):
+            return index
+        following = self.next_enabled_index(index, 1)
+        if following is not None:
+            return following
+        return self.next_enabled_index(index, -1)
+
+    # navigation
+
+    def show_month(self, month: datetime.date) -> None:
+        """Display the month of the given date. A cursor on a day which
+        becomes empty moves like described at fallback_index, a cursor on a
+        disabled day to the nearest selectable day."""
+        old_day = self.day_at(self.cursor) if self.cursor is not None else None
+        self.month = add_months(month, 0)
+        if old_day is None:
+            return
+        if not self.layout.is_day(self.cursor):
+            self.cursor = fallback_index(old_day)
+        index = self.enabled_index(self.cursor)
+        if index is not None:
+            self.cursor = index
+
+    def move_month(self, month_count: int) -> None:
+        self.show_month(add_months(self.month, month_count))
+
+    def _cursor_on_day(self) -> bool:
+        """True if the cursor is on a day. A cursor on an empty day is put
+        on the nearest day of the month instead of moving it."""
+        if self.cursor is None:
+            return False
+        layout = self.layout
+        if not layout.is_day(self.cursor):
+            self.cursor = min(max(self.cursor, layout.first_index), layout.last_index)
+            return False
+        return True
+
+    def left(self) -> None:
+        """Cursor to the previous day, to the previous month on the 1st or
+        at the start of a week."""
+        if not self._cursor_on_day():
+            return
+        index = None
+        if self.day_at(self.cursor) != 1 and self.cursor % 7 != 0:
+            index = self.next_enabled_index(self.cursor, -1)
+        if index is None:
+            self.move_month(-1)
+        else:
+            self.cursor = index
+
+    def right(self) -> None:
+        """Cursor to the next day, to the next month on the last day or at
+        the end of a week."""
+        if not self._cursor_on_day():
+            return
+        index = None
+        # there is always an empty day behind the last day
+        if self.cursor % 7 != 6 and self.day_at(self.cursor + 1) is not None:
+            index = self.next_enabled_index(self.cursor, 1)
+        if index is None:
+            self.move_month(1)
+        else:
+            self.cursor = index
+
+    def down(self) -> None:
+        """Cursor to the same weekday of the next week, if in the month."""
+        if not self._cursor_on_day() or self.cursor + 7 >= 42:
+            return
+        if self.day_at(self.cursor + 7) is None:
+            return
+        index = self.next_enabled_index(self.cursor, 7)
+        if index is not None:
+            self.cursor = index
+
+    def up(self) -> None:
+        """Cursor to the same weekday of the previous week, if in the month."""
+        if not self._cursor_on_day() or self.day_at(self.cursor) <= 7:
+            return
+        index = self.next_enabled_index(self.cursor, -7)
+        if index is not None:
+            self.cursor = index
+
+    def move_days(self, days: int) -> None:
+        """Cursor by a number of days, into other months without the nudging
+        rules (like the MultiMonthPicker moves). Disabled days are skipped
+        in steps of days, for at most a year."""
+        if not self._cursor_on_day():
+            return
+        date = self.cursor_date
+        for _ in range(366):
+            date += datetime.timedelta(days=days)
+            if self.is_enabled(date):
+                self.month = add_months(date, 0)
+                self.cursor = self.layout.index_of(date.day)
+                return
+
+    def home(self, today: datetime.date) -> None:
+        """Display the month of today with the cursor on today, or on the
+        nearest selectable day if today is disabled."""
+        self.month = add_months(today, 0)
+        index = self.layout.index_of(today.day)
+        enabled = self.enabled_index(index)
+        self.cursor = enabled if enabled is not None else index
+
+    # selection
+
+    def select(self, date: datetime.date) -> bool:
+        """Select a date, False if it can't be selected. In range mode, the
+        first date starts a range, the second one ends it."""
+        if not self.is_enabled(date):
+            return False
+        self.selection = date
+        if self.select_range:
+            if self.range_start is None or self.range_end is not None:
+                self.range_start = date
+                self.range_end = None
+                self.range_preview = date
+            else:
+                self.range_end = date
+                self.range_preview = None
+        return True
+
+    def clear_selection(self) -> None:
+        """Forget the selected date and range."""
+        self.selection = None
+        self.range_start = self.range_end = self.range_preview = None
+
+    @property
+    def range_complete(self) -> bool:
+        """True if start and end of a range are selected."""
+        return self.range_end is not None
+
+    def range_bounds(self) -> tuple[datetime.date, datetime.date] | None:
+        """The first and the last date of the range (start and end may be
+        selected in any order), including the preview. None if no range."""
+        if self.range_start is None:
+            return None
+        end = self.range_end or self.range_preview or self.range_start
+        return min(self.range_start, end), max(self.range_start, end)
+
+    def preview(self, date: datetime.date) -> bool:
+        """Preview the end of an open range, False if there is none."""
+        if not self.select_range or self.range_start is None or self.range_complete:
+            return False
+        self.range_preview = date
+        return True
+
+    def range_indexes(self) -> range:
+        """The indexes of the days of the displayed month within the range."""
+        bounds = self.range_bounds()
+        if bounds is None:
+            return range(0)
+        layout = self.layout
+        last = self.month.replace(day=layout.days[layout.last_index])
+        start, end = max(bounds[0], self.month), min(bounds[1], last)
+        if start > end:
+            return range(0)
+        return range(layout.index_of(start.day), layout.index_of(end.day) + 1)
+
+    def today_index(self, today: datetime.date) -> int | None:
+        """The index of today, if today is in the displayed month."""
+        return self.index_of(today)
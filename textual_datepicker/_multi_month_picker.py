@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import datetime
+
+from textual.app import ComposeResult
+from textual.widget import Widget, events
+from textual.widgets import Button
+from textual.containers import Container, Horizontal, Vertical
+from textual.reactive import reactive
+from textual.message import Message
+
+from ._calendar import MonthLayout, month_layout
+from ._clock import Clock, get_clock
+from ._date_picker import (
+    DayGrid,
+    MonthControl,
+    MonthHeader,
+    WeekdayContainer,
+    WeekdayLabel,
+    _this_month,
+)
+from ._dates import DateAdapter, add_months, get_date_adapter
+from ._format import CalendarNames, calendar_names
+from ._model import CalendarModel
+
+
+class MonthPane(Vertical):
+    """One month of the MultiMonthPicker. The panes are reused for other
+    months when the picker scrolls."""
+
+    def __init__(
+        self,
+        index: int,
+        month: datetime.date,
+        today_index: int | None,
+        names: CalendarNames,
+    ):
+        # position of the pane in the picker
+        self.index = index
+        # the displayed month (the first of the month)
+        self.month = month
+        self.names = names
+        self.month_header = MonthHeader(date=month, names=names)
+        self.day_grid = DayGrid(self.layout.days, today_index)
+        super().__init__(
+            self.month_header,
+            WeekdayContainer(*[WeekdayLabel(day) for day in names.weekdays]),
+            self.day_grid,
+        )
+
+    @property
+    def layout(self) -> MonthLayout:
+        return month_layout(self.month.year, self.month.month, self.names.firstweekday)
+
+    def show_month(self, month: datetime.date, today_index: int | None) -> None:
+        """Show another month in this pane."""
+        if month != self.month:
+            self.month = month
+            self.month_header.update(date=month)
+        self.day_grid.update(self.layout.days, today_index)
+
+
+class MultiMonthPicker(Widget):
+    """Several months side by side (e.g. 3 months, or a year with 12 months
+    in 4 columns). Scrolling by month reuses the panes, so there are never
+    more panes than visible months."""
+
+    DEFAULT_CSS = """
+    MultiMonthPicker {
+        width: auto;
+        height: auto;
+    }
+    MultiMonthPicker .header {
+        height: 1;
+        width: 100%;
+    }
+    MultiMonthPicker .header .right {
+        dock: right;
+    }
+    MultiMonthPicker MonthControl {
+        width: 3;
+        max-width: 3;
+    }
+    MultiMonthPicker .panes {
+        layout: grid;
+        width: auto;
+        height: auto;
+        grid-columns: 28;
+        grid-rows: 15;
+        grid-gutter: 0 2;
+    }
+    MultiMonthPicker MonthPane {
+        width: 26;
+        height: 15;
+        box-sizing: content-box;
+        padding: 0 1;
+    }
+    MultiMonthPicker MonthHeader {
+        width: 26;
+        height: 2;
+    }
+    MultiMonthPicker WeekdayContainer {
+        layout: grid;
+        grid-size: 7;
+        grid-columns: 2;
+        grid-rows: 1;
+        grid-gutter: 1 2;
+        height: 2;
+    }
+    MultiMonthPicker WeekdayLabel {
+        color: $text-muted;
+    }
+    """
+
+    # the first displayed month (always the first of the month)
+    date = reactive(_this_month)
+
+    # The selected date (on enter, click)
+    selected_date: datetime.date | None = None
+
+    # A target widget where to send the message for a selected date
+    target: Widget | None = None
+
+    def __init__(
+        self,
+        months: int = 3,
+        columns: int | None = None,
+        clock: Clock | None = None,
+        date_adapter: DateAdapter | None = None,
+        locale: str | None = None,
+        firstweekday: int | None = None,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ):
+        super().__init__(name=name, id=id, classes=classes)
+        # the reused panes, one per visible month
+        self.panes: list[MonthPane] = []
+        # number of visible months, and of panes
+        self.months = months
+        # panes per row, all in one row if None
+        self.columns = columns if columns is not None else months
+        self.clock = clock if clock is not None else get_clock()
+        # weekday headers and month names of the locale, the weekday headers
+        # start with firstweekday (0 is monday)
+        self.names = calendar_names(locale, firstweekday)
+        self.date_adapter = (
+            date_adapter if date_adapter is not None else get_date_adapter()
+        )
+        # cursor movements, the model displays the month of the focused pane
+        self.model = CalendarModel(
+            self.clock.today(), firstweekday=self.names.firstweekday)
+        if clock is not None or date_adapter is not None:
+            self.date = self.date_adapter.from_local_date(
+                self.clock.today().replace(day=1))
+
+    def compose(self) -> ComposeResult:
+        self.panes = [
+            MonthPane(index, month, self._today_index(month), self.names)
+            for index, month in enumerate(self._visible_months())
+        ]
+        panes = Container(*self.panes, classes="panes")
+        panes.styles.grid_size_columns = self.columns
+        yield Horizontal(
+            MonthControl("<", classes="left"),
+            MonthControl(">", classes="right"),
+            classes="header"
+        )
+        yield panes
+
+    def on_mount(self) -> None:
+        self._schedule_new_day()
+
+    def _schedule_new_day(self) -> None:
+        """Move the today marker at midnight."""
+        delay = self.clock.seconds_until_tomorrow()
+        if delay is not None:
+            self.set_timer(delay, self._on_new_day)
+
+    def _on_new_day(self) -> None:
+        self._show_months()
+        self._schedule_new_day()
+
+    def watch_date(self, _old_date, _new_date) -> None:
+        if not self.panes:
+            # not yet composed, compose uses the new date
+            return
+        self._show_months()
+
+    def _show_months(self) -> None:
+        """Show the visible months and today in the panes."""
+        with self.app.batch_update():
+            for pane, month in zip(self.panes, self._visible_months()):
+                pane.show_month(month, self._today_index(month))
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.has_class("left"):
+            self._move_month(-1)
+        if event.button.has_class("right"):
+            self._move_month(1)
+
+    def on_day_grid_selected(self, event: DayGrid.Selected) -> None:
+        pane = event.sender.parent
+        self.selected_date = self.date_adapter.from_date(
+            pane.month.replace(day=event.day))
+
+        self.post_message(self.Selected(self, self.selected_date))
+
+        if self.target is not None:
+            self.target.post_message(self.Selected(self, self.selected_date))
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "pageup":
+            event.prevent_default()
+            self._move_month(-1)
+        if event.key == "pagedown":
+            event.prevent_default()
+            self._move_month(1)
+        if event.key == "left":
+            event.prevent_default()
+            self._move_focus(-1)
+        if event.key == "right":
+            event.prevent_default()
+            self._move_focus(1)
+        if event.key == "down":
+            event.prevent_default()
+            self._move_focus(7)
+        if event.key == "up":
+            event.prevent_default()
+            self._move_focus(-7)
+        if event.key == "home":
+            event.prevent_default()
+            self.model.home(self.clock.today())
+            self.focus_date(self.model.cursor_date)
+
+    @property
+    def focused_date(self) -> datetime.date | None:
+        """The focused day, None if no day has the focus."""
+        pane = self._focused_pane()
+        if pane is None or pane.day_grid.day is None:
+            return None
+        return pane.month.replace(day=pane.day_grid.day)
+
+    def focus_date(self, date: datetime.date) -> None:
+        """Focus the given day, scroll to its month if it is not visible."""
+        offset = (date.year - self.date.year) * 12 + date.month - self.date.month
+        if offset < 0:
+            self._move_month(offset)
+            offset = 0
+        elif offset >= self.months:
+            self._move_month(offset - self.months + 1)
+            offset = self.months - 1
+
+        pane = self.panes[offset]
+        pane.day_grid.move_cursor(pane.layout.index_of(date.day))
+
+    def _visible_months(self) -> [datetime.date]:
+        first = add_months(self.date, 0)
+        return [add_months(first, index) for index in range(self.months)]
+
+    def _move_month(self, month_count: int) -> None:
+        self.date = self.date_adapter.from_date(add_months(self.date, month_count))
+
+    def _move_focus(self, days: int) -> None:
+        pane = self._focused_pane()
+        if pane is None or pane.day_grid.day is None:
+            return
+        self.model.month = pane.month
+        self.model.cursor = pane.day_grid.cursor
+        self.model.move_days(days)
+        self.focus_date(self.model.cursor_date)
+
+    def _focused_pane(self) -> MonthPane | None:
+        focused = self.app.focused
+        if not isinstance(focused, DayGrid):
+            return None
+        pane = focused.parent
+        if not isinstance(pane, MonthPane) or pane not in self.panes:
+            return None
+        return pane
+
+    def _today_index(self, month: datetime.date) -> int | None:
+        today = self.clock.today()
+        if today.year != month.year or today.month != month.month:
+            return None
+        return month_layout(
+            month.year, month.month, self.names.firstweekday).index_of(today.day)
+
+    class Selected(Message):
+        """A date was selected."""
+
+        def __init__(self, sender: MultiMonthPicker, date: datetime.date) -> None:
+            self.date = date
+            super().__init__()
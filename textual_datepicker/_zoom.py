@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import datetime
+import re
+
+from rich.segment import Segment
+
+from textual.strip import Strip
+from textual.geometry import Region
+from textual.widget import Widget, events
+from textual.widgets import Input
+from textual.containers import Vertical
+from textual.message import Message
+
+from ._metrics import Metrics, timed
+
+# year, month and day of a typed date, e.g. 2022-08-15, 2022-08 or 2022
+_GO_TO_PATTERN = re.compile(r"^\s*(\d{4})(?:[-./ ](\d{1,2})(?:[-./ ](\d{1,2}))?)?\s*$")
+
+
+def parse_go_to(text: str) -> datetime.date | None:
+    """The date of a typed "go to" text (YYYY-MM-DD, YYYY-MM or YYYY), None
+    if it is not a valid date."""
+    match = _GO_TO_PATTERN.match(text)
+    if match is None:
+        return None
+    year, month, day = (int(part) if part else 1 for part in match.groups())
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+class ZoomGrid(Widget, can_focus=True):
+    """12 months of a year or 12 years around a decade, rendered by one
+    widget in 3 columns. The focused item is a cursor index."""
+
+    COMPONENT_CLASSES = {
+        "zoom-grid--current",
+        "zoom-grid--cursor",
+        "zoom-grid--hover",
+    }
+
+    DEFAULT_CSS = """
+    ZoomGrid {
+        width: 26;
+        height: 8;
+    }
+    ZoomGrid > .zoom-grid--current {
+        color: $secondary-lighten-1;
+        text-style: bold;
+    }
+    ZoomGrid > .zoom-grid--cursor {
+        text-style: bold reverse;
+    }
+    ZoomGrid > .zoom-grid--hover {
+        background: $surface-lighten-2;
+    }
+    """
+
+    COLUMNS = 3
+    CELL_WIDTH = 8
+    COLUMN_GUTTER = 1
+    ROW_GUTTER = 1
+
+    def __init__(
+        self,
+        items: [str],
+        current: int | None = None,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ):
+        super().__init__(name=name, id=id, classes=classes)
+        self.items: tuple[str, ...] = ()
+        self.current: int | None = None
+        self.cursor = 0
+        # index of the item below the mouse
+        self.hover: int | None = None
+        # records the renders, set by the DatePicker
+        self.metrics: Metrics | None = None
+        self.set_items(items, current)
+
+    def set_items(self, items: [str], current: int | None) -> None:
+        """Show other items, the cursor moves to the current one."""
+        self.items = tuple(items)
+        self.current = current
+        self.cursor = current if current is not None else 0
+        self.refresh()
+
+    def move_cursor(self, index: int) -> None:
+        old_cursor = self.cursor
+        self.cursor = index
+        self.refresh_items(old_cursor, index)
+
+    def refresh_items(self, *indexes: int | None) -> None:
+        """Repaint the lines with the items at the given indexes."""
+        width = self.size.width
+        cell_y = 1 + self.ROW_GUTTER
+        for row in {index // self.COLUMNS for index in indexes if index is not None}:
+            self.refresh(Region(0, row * cell_y, width, 1))
+
+    def index_at(self, x: int, y: int) -> int | None:
+        """The index of the item at the given offset, None if not on an item."""
+        cell_x = self.CELL_WIDTH + self.COLUMN_GUTTER
+        cell_y = 1 + self.ROW_GUTTER
+        if x < 0 or y < 0 or x % cell_x >= self.CELL_WIDTH or y % cell_y >= 1:
+            return None
+        index = y // cell_y * self.COLUMNS + x // cell_x
+        if x // cell_x >= self.COLUMNS or index >= len(self.items):
+            return None
+        return index
+
+    @timed("zoom_render")
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        base_style = self.rich_style
+        cell_y = 1 + self.ROW_GUTTER
+        first = y // cell_y * self.COLUMNS
+        if y % cell_y or first >= len(self.items):
+            return Strip.blank(width, base_style)
+
+        current_style = self.get_component_rich_style("zoom-grid--current")
+        cursor_style = self.get_component_rich_style("zoom-grid--cursor")
+        hover_style = self.get_component_rich_style("zoom-grid--hover")
+        gutter = Segment(" " * self.COLUMN_GUTTER, base_style)
+
+        segments = []
+        for index in range(first, min(first + self.COLUMNS, len(self.items))):
+            if index != first:
+                segments.append(gutter)
+            style = base_style
+            if index == self.current:
+                style += current_style
+            if index == self.hover:
+                style += hover_style
+            if index == self.cursor and self.has_focus:
+                style += cursor_style
+            segments.append(Segment(f"{self.items[index]:^{self.CELL_WIDTH}}", style))
+
+        return Strip(segments).adjust_cell_length(width, base_style)
+
+    def on_focus(self, _event: events.Focus) -> None:
+        self.refresh_items(self.cursor)
+
+    def on_blur(self, _event: events.Blur) -> None:
+        self.refresh_items(self.cursor)
+
+    def on_key(self, event: events.Key) -> None:
+        steps = {"left": -1, "right": 1, "up": -self.COLUMNS, "down": self.COLUMNS}
+        if event.key in steps:
+            event.stop()
+            event.prevent_default()
+            index = self.cursor + steps[event.key]
+            if 0 <= index < len(self.items):
+                self.move_cursor(index)
+        if event.key == "enter":
+            event.stop()
+            self.post_message(self.Selected(self, self.cursor))
+
+    def on_click(self, event: events.MouseEvent) -> None:
+        index = self.index_at(event.x, event.y)
+        if index is None:
+            return
+
+        self.move_cursor(index)
+        self.post_message(self.Selected(self, index))
+
+    def on_mouse_move(self, event: events.MouseMove) -> None:
+        index = self.index_at(event.x, event.y)
+        if index != self.hover:
+            self.refresh_items(self.hover, index)
+            self.hover = index
+
+    def on_leave(self, _event: events.Leave) -> None:
+        if self.hover is not None:
+            self.refresh_items(self.hover)
+            self.hover = None
+
+    class Selected(Message):
+        """An item was selected."""
+
+        def __init__(self, sender: ZoomGrid, index: int) -> None:
+            self.sender = sender
+            self.index = index
+            super().__init__()
+
+
+class ZoomView(Vertical):
+    """The year or decade view of the DatePicker, with an input to go to a
+    typed date."""
+
+    DEFAULT_CSS = """
+    ZoomView {
+        height: 13;
+    }
+    ZoomView Input {
+        width: 26;
+    }
+    """
+
+    def __init__(self, zoom_grid: ZoomGrid):
+        self.zoom_grid = zoom_grid
+        self.go_to_input = Input(placeholder="YYYY-MM-DD")
+        super().__init__(zoom_grid, self.go_to_input)